@@ -1,12 +1,38 @@
 ## INFO ##
 ## INFO ##
 
-# Import argon modules
-from argon.text    import (Section,
-                           Header,
-                           Paragraph,
-                           Span,
-                           Flags)
-from argon.pattern import (Pattern,
-                           Program)
-from argon.scheme  import Scheme
+# Names of the public argon objects, and the modules which define them. The
+# modules are only imported when one of their objects is used for the first
+# time, so `import argon` itself is as cheap as it can be
+__all__ = ('Section',
+           'Header',
+           'Paragraph',
+           'Span',
+           'Flags',
+           'Pattern',
+           'Program',
+           'Lazy',
+           'Scheme')
+
+_MODULES = {'Section'   : 'argon.text',
+            'Header'    : 'argon.text',
+            'Paragraph' : 'argon.text',
+            'Span'      : 'argon.text',
+            'Flags'     : 'argon.text',
+            'Pattern'   : 'argon.pattern',
+            'Program'   : 'argon.pattern',
+            'Lazy'      : 'argon.pattern',
+            'Scheme'    : 'argon.scheme'}
+
+
+#------------------------------------------------------------------------------#
+def __getattr__(name):
+    try:
+        module = _MODULES[name]
+    except KeyError:
+        raise AttributeError('module {!r} has no attribute '
+                             '{!r}'.format(__name__, name)) from None
+    # Import argon module
+    value = getattr(__import__(module, fromlist=(name,)), name)
+    globals()[name] = value
+    return value
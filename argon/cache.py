@@ -0,0 +1,107 @@
+## INFO ##
+## INFO ##
+
+# Import python modules
+from os      import environ, makedirs, replace, unlink
+from os.path import expanduser, join
+from marshal import dumps, loads, version
+
+# Import argon modules
+from argon.pattern import Pattern, Lazy
+
+# Version of the layout of the stored data, change it
+# when the internal structures of Scheme are changed
+FORMAT = 2
+
+
+
+#------------------------------------------------------------------------------#
+def cache_directory():
+    """
+    Returns the default directory of the compiled schemes, which is either
+    $XDG_CACHE_HOME/argon or ~/.cache/argon
+    """
+    return join(environ.get('XDG_CACHE_HOME') or expanduser('~/.cache'),
+                'argon')
+
+
+
+#------------------------------------------------------------------------------#
+def fingerprint(patterns, options):
+    """
+    Returns a hexadecimal digest of the structure of the declaration: names,
+    flags, types, members and value options of all patterns, and the options
+    set on the Scheme. Descriptions are not part of the fingerprint.
+    """
+    # Import python modules (only when caching is used)
+    from hashlib import blake2b
+
+    declaration = [FORMAT, version, options]
+    for pattern in patterns:
+        declaration.append(
+            (pattern.name,
+             sorted(pattern.flags),
+             tuple(pattern.prefices),
+             pattern.flag_type,
+             pattern.member_type,
+             pattern.member_necessity,
+             pattern.object_hook.__name__,
+             pattern.value_necessity,
+             pattern.flag_groupable,
+             pattern.value_immediate,
+             pattern.value_delimiter,
+             pattern.double_dash,
+             sorted(_member(m) for m in pattern.members)))
+    return blake2b(repr(declaration).encode(), digest_size=16).hexdigest()
+
+
+
+#------------------------------------------------------------------------------#
+def _member(member):
+    # Patterns are referenced by their names, and lazy members by their names,
+    # their flags and their loaders, if those are '<module>:<attribute>'
+    # references (callables are not the same objects in every process)
+    if isinstance(member, Pattern):
+        return member.name
+    elif isinstance(member, Lazy):
+        loader = member.loader
+        return repr((member.name,
+                     tuple(member.flags),
+                     loader if isinstance(loader, str) else None))
+    return repr(member)
+
+
+
+#------------------------------------------------------------------------------#
+def read_cache(directory, key):
+    """
+    Returns the stored data of the compiled scheme or None if it is not
+    cached, or if the cached file cannot be used
+    """
+    try:
+        with open(join(directory, key), 'rb') as file:
+            return loads(file.read())
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+
+
+
+#------------------------------------------------------------------------------#
+def write_cache(directory, key, data):
+    """
+    Stores the data of the compiled scheme atomically. Caching is only an
+    optimisation, therefore if the file cannot be written, it is ignored.
+    """
+    # Import python modules (only when caching is used)
+    from tempfile import NamedTemporaryFile
+
+    try:
+        makedirs(directory, exist_ok=True)
+        with NamedTemporaryFile(dir=directory, delete=False) as file:
+            file.write(dumps(data))
+        replace(file.name, join(directory, key))
+    except OSError:
+        try:
+            unlink(file.name)
+        except (NameError, OSError):
+            pass
@@ -0,0 +1,386 @@
+## INFO ##
+## INFO ##
+
+"""
+Generate a standalone parser module from a Scheme. The generated module does
+not import argon, dagger or orderedset (nor anything else, except os.path when
+the path of a program is used), its flag dispatch, context hierarchy and value
+handling are hard-coded, and its parse_iter and parse_args functions return the
+same ('<long_flag>', <value(s)>, [<member(s)>]) tuples as Scheme.parse_iter,
+with two differences: UNIQUE_ARRAY values are lists (without duplicates)
+instead of OrderedSets, and NAMED_VALUES are dicts instead of OrderedDicts.
+
+Usage:
+
+    python3 -m argon.generator <module>:<scheme> <output-file>
+"""
+
+# Import python modules
+from sys import argv, exit, stderr
+
+# Import argon modules
+from argon.pattern import Pattern
+
+
+# Runtime part of the generated module, which
+# is the same for every generated parser
+RUNTIME = '''
+
+#------------------------------------------------------------------------------#
+# Errors
+class SchemeException(Exception)              : pass
+class InvalidArgument(SchemeException)        : pass
+class ArgumentOutOfContext(SchemeException)   : pass
+class DoubleUniqueArgument(SchemeException)   : pass
+class DoublePrimalArgument(SchemeException)   : pass
+class TooManyMembersUsed(SchemeException)     : pass
+class MissingMember(SchemeException)          : pass
+class PatternException(Exception)             : pass
+class FinishedPattern(PatternException)       : pass
+class UnfinishedPattern(PatternException)     : pass
+
+
+#------------------------------------------------------------------------------#
+class EOL:
+    def __repr__(self):
+        return '<EOL>'
+
+
+#------------------------------------------------------------------------------#
+class STATE_SWITCH:
+
+    def __init__(self, name, flag, is_required):
+        self._flag = flag
+
+    def add_value(self, value):
+        raise FinishedPattern(STATE_SWITCH, self._flag, value)
+
+    def close(self, name, flag):
+        return True
+
+
+#------------------------------------------------------------------------------#
+class SINGLE_VALUE:
+
+    def __init__(self, name, flag, is_required):
+        self._flag        = flag
+        self._values      = None
+        self._is_required = is_required
+
+    def add_value(self, value):
+        if self._values is not None:
+            raise FinishedPattern(SINGLE_VALUE, self._flag, value)
+        self._values = value
+
+    def close(self, name, flag):
+        if (self._is_required and
+            self._values is None):
+                raise UnfinishedPattern(
+                    SINGLE_VALUE, self._flag,
+                    EOL() if name is NotImplemented else flag)
+        return self._values
+
+
+#------------------------------------------------------------------------------#
+class COMMON_ARRAY:
+
+    def __init__(self, name, flag, is_required):
+        self._flag        = flag
+        self._values      = []
+        self.add_value    = self._values.append
+        self._is_required = is_required
+
+    def close(self, name, flag):
+        if (self._is_required and
+            not self._values):
+                raise UnfinishedPattern(
+                    COMMON_ARRAY, self._flag,
+                    EOL() if name is NotImplemented else flag)
+        return self._values
+
+
+#------------------------------------------------------------------------------#
+class UNIQUE_ARRAY:
+
+    def __init__(self, name, flag, is_required):
+        self._flag        = flag
+        self._values      = {}
+        self._is_required = is_required
+
+    def add_value(self, value):
+        self._values[value] = None
+
+    def close(self, name, flag):
+        if (self._is_required and
+            not self._values):
+                raise UnfinishedPattern(
+                    UNIQUE_ARRAY, self._flag,
+                    EOL() if name is NotImplemented else flag)
+        return list(self._values)
+
+
+#------------------------------------------------------------------------------#
+class NAMED_VALUES:
+
+    def __init__(self, name, flag, is_required):
+        self._flag        = flag
+        self._key         = NotImplemented
+        self._values      = {}
+        self._is_required = is_required
+
+    def add_value(self, value):
+        if self._key is NotImplemented:
+            self._key = value
+        else:
+            self._values[self._key] = value
+            self._key = NotImplemented
+
+    def close(self, name, flag):
+        if (self._key is not NotImplemented or
+            (self._is_required and
+             not self._values)):
+                raise UnfinishedPattern(
+                    NAMED_VALUES, self._flag,
+                    EOL() if name is NotImplemented else flag)
+        return self._values
+
+
+#------------------------------------------------------------------------------#
+def split(argument):
+    node  = PREFIX_INDEX
+    found = rank = None
+    for length, char in enumerate(argument, start=1):
+        try:
+            node = node[char]
+        except KeyError:
+            break
+        try:
+            order, delimiter, groupable, immediate, prefices = node['']
+        except KeyError:
+            continue
+        if rank is not None and rank[0] <= order:
+            continue
+        flag = argument[:length]
+        rest = argument[length:]
+        if (delimiter and
+            rest.startswith(delimiter) and
+            len(rest) > len(delimiter)):
+                found = flag, rest[len(delimiter):]
+                rank  = order, 0
+                continue
+        if groupable:
+            for prefix in prefices:
+                if argument.startswith(prefix):
+                    break
+            else:
+                prefix = None
+            if prefix is not None:
+                found = flag, prefix + rest
+                rank  = order, 1
+                continue
+        if immediate and rest:
+            found = flag, rest
+            rank  = order, 2
+    return found
+
+
+#------------------------------------------------------------------------------#
+def select(argument):
+    from os.path import basename
+    name = basename(argument)
+    if name != argument:
+        record = DISPATCH.get(name)
+        if record is not None and record[0] in ROOTS:
+            return name
+    return None
+
+
+#------------------------------------------------------------------------------#
+def parse_iter(arguments):
+    arguments    = iter(arguments)
+    pushed_back  = []
+    unique_flags = set()
+    stack        = []
+    context_path = []
+    children     = ROOTS
+    primals      = set()
+    ones         = None
+    values       = None
+    members      = None
+    double_dash  = ''
+    need_members = None
+    argument     = None
+
+    while True:
+        if pushed_back:
+            argument = pushed_back.pop()
+        else:
+            argument = next(arguments, NotImplemented)
+            if argument is NotImplemented:
+                break
+
+        record = DISPATCH.get(argument)
+        if record is None:
+            separated = split(argument)
+            if separated:
+                flag, value = separated
+                pushed_back.append(value)
+                pushed_back.append(flag)
+                continue
+            if values is None:
+                program = select(argument)
+                if program is not None:
+                    pushed_back.append(program)
+                    continue
+                raise InvalidArgument(argument)
+            if (double_dash and
+                argument == double_dash):
+                    while pushed_back:
+                        values.add_value(pushed_back.pop())
+                    for argument in arguments:
+                        values.add_value(argument)
+                    break
+            values.add_value(argument)
+            continue
+
+        (name, flag_type, member_one, member_required, object_hook,
+         value_necessity, pattern_double_dash, pattern_children,
+         pattern_members) = record
+
+        if flag_type == UNIQUE:
+            if name in unique_flags:
+                raise DoubleUniqueArgument(argument)
+            unique_flags.add(name)
+
+        while name not in children:
+            if need_members:
+                raise MissingMember(argument, need_members[0],
+                                    list(need_members[1]))
+            if len(stack) < 2:
+                raise ArgumentOutOfContext(context_path, argument)
+            closed_name, closed_values, closed_members, *_ = stack.pop()
+            (_, values, members, children,
+             primals, ones, double_dash) = stack[-1]
+            members.append((closed_name,
+                            closed_values.close(name, argument),
+                            closed_members))
+
+        del context_path[len(stack):]
+        context_path.append(argument)
+
+        if flag_type == PRIMAL:
+            if name in primals:
+                raise DoublePrimalArgument(context_path[-2], argument)
+            primals.add(name)
+
+        need_members = \\
+            (argument, pattern_members) if member_required else None
+
+        if ones is not None:
+            ones[name] = argument
+            if len(ones) > 1:
+                ones.pop(name)
+                raise TooManyMembersUsed(context_path[-2],
+                                         ones.popitem()[1],
+                                         argument)
+
+        values      = object_hook(name, argument, value_necessity)
+        members     = []
+        children    = pattern_children
+        primals     = set()
+        ones        = {} if member_one else None
+        double_dash = pattern_double_dash
+        stack.append((name, values, members, children,
+                      primals, ones, double_dash))
+
+    if not stack:
+        return []
+
+    if need_members:
+        raise MissingMember(EOL(), need_members[0], list(need_members[1]))
+
+    while len(stack) > 1:
+        closed_name, closed_values, closed_members, *_ = stack.pop()
+        _, values, members, *_ = stack[-1]
+        members.append((closed_name,
+                        closed_values.close(NotImplemented, argument),
+                        closed_members))
+
+    return [(stack[0][0], values.close(NotImplemented, argument), members)]
+
+
+#------------------------------------------------------------------------------#
+def parse_args(*arguments):
+    return parse_iter(arguments)
+'''
+
+
+
+#------------------------------------------------------------------------------#
+def generate_module(scheme, path):
+    """
+    Write a standalone parser module of the (compiled) scheme to path
+    """
+    if scheme._dispatch is None:
+        scheme.compile()
+
+    # Write the records of the patterns, object hooks are referenced by
+    # the names of the value type classes defined in the generated module
+    records = {}
+    for flag, record in sorted(scheme._dispatch.items()):
+        records[record[0]] = record
+    lines = ['UNIQUE = {!r}'.format(Pattern.UNIQUE),
+             'PRIMAL = {!r}'.format(Pattern.PRIMAL),
+             '',
+             '_RECORDS = {']
+    for name, record in records.items():
+        (name, flag_type, member_one, member_required, object_hook,
+         value_necessity, double_dash, members, member_flags) = record
+        lines.append('    {!r}: ({!r}, {!r}, {!r}, {!r}, {}, {!r}, {!r}, '
+                     'frozenset({!r}), {!r}),'.format(
+                        name, name, flag_type, member_one, member_required,
+                        object_hook.__name__, value_necessity, double_dash,
+                        tuple(sorted(members)), member_flags))
+    lines.append('}')
+    lines.append('')
+    lines.append('DISPATCH = {')
+    for flag, record in sorted(scheme._dispatch.items()):
+        lines.append('    {!r}: _RECORDS[{!r}],'.format(flag, record[0]))
+    lines.append('}')
+    lines.append('')
+    lines.append('ROOTS = frozenset({!r})'.format(tuple(sorted(scheme._roots))))
+    lines.append('')
+    lines.append('PREFIX_INDEX = {!r}'.format(scheme._prefix_index))
+
+    # Records reference the object hooks, therefore
+    # those have to be defined before the tables
+    with open(path, 'w') as file:
+        file.write('# Generated by argon.generator, do not edit')
+        file.write(RUNTIME)
+        file.write('\n\n#' + '-'*78 + '#\n')
+        file.write('\n'.join(lines))
+        file.write('\n')
+
+
+
+#------------------------------------------------------------------------------#
+def main(arguments):
+    # Import python modules (only when used from the command line)
+    from errno     import EINVAL
+    from importlib import import_module
+
+    try:
+        _, reference, path = arguments
+        module, _, attribute = reference.partition(':')
+        scheme = getattr(import_module(module), attribute)
+    except (ValueError, ImportError, AttributeError) as error:
+        print(__doc__.strip(), error, sep='\n\n', file=stderr)
+        return EINVAL
+    generate_module(scheme, path)
+    return 0
+
+
+
+#------------------------------------------------------------------------------#
+if __name__ == '__main__':
+    exit(main(argv))
@@ -0,0 +1,154 @@
+## INFO ##
+## INFO ##
+
+"""
+Pre-rendered help texts. At build time build_help_file renders the help text
+of every context (pattern) of a Scheme, both plain and colored, for several
+widths, and stores them in a single indexed file. At runtime HelpFile maps
+the file into memory, and writes the stored text of a context to a stream,
+without constructing or wrapping any text blocks.
+
+Usage:
+
+    python3 -m argon.helpfile <module>:<scheme> <output-file> [<width>...]
+"""
+
+# Import python modules
+from sys     import argv, exit, stderr, stdout
+from mmap    import mmap, ACCESS_READ
+from marshal import dumps, loads
+
+# Import argon modules
+from argon.text import colors_available
+
+# Identifier of help files, change its version when the layout is changed
+MAGIC = b'argon-help-1\0'
+
+# Widths of the help texts rendered by default
+WIDTHS = (80, 100, 120, 160)
+
+
+
+#------------------------------------------------------------------------------#
+def build_help_file(scheme, path, widths=WIDTHS, tab_size=4):
+    """
+    Write the help texts of all contexts of scheme (see Scheme.context_blocks,
+    without the options of the contexts above them) to path, plain and colored,
+    for each width of widths. The layout of the file is: MAGIC, the size of
+    the index (8 bytes, little-endian), the index, which maps (<context>,
+    <width>, <color>) keys to (<offset>, <size>) values, and the UTF-8 texts.
+    """
+    # Lazy members of the scheme are loaded, so all of them are stored
+    scheme._load_members()
+    index  = {}
+    texts  = []
+    offset = 0
+    for name in scheme._patterns:
+        blocks = scheme.context_blocks((name,))
+        for width in widths:
+            for color in (False, True):
+                text = scheme._render(blocks, width, tab_size, color).encode()
+                index[name, width, color] = offset, len(text)
+                texts.append(text)
+                offset += len(text)
+
+    index = dumps(index)
+    with open(path, 'wb') as file:
+        file.write(MAGIC)
+        file.write(len(index).to_bytes(8, 'little'))
+        file.write(index)
+        file.writelines(texts)
+
+
+
+#------------------------------------------------------------------------------#
+class HelpFile:
+    """
+    Memory mapped help file written by build_help_file
+    """
+
+    #- - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - #
+    def __init__(self, path):
+        with open(path, 'rb') as file:
+            if file.read(len(MAGIC)) != MAGIC:
+                raise ValueError('Not an argon help file: {!r}'.format(path))
+            size = int.from_bytes(file.read(8), 'little')
+            self._index = loads(file.read(size))
+            self._start = len(MAGIC) + 8 + size
+            self._map   = mmap(file.fileno(), 0, access=ACCESS_READ)
+        self._widths = sorted({width for _, width, _ in self._index})
+
+
+    #- - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - #
+    def __enter__(self):
+        return self
+
+
+    #- - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - #
+    def __exit__(self, *exception):
+        self.close()
+
+
+    #- - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - #
+    def close(self):
+        self._map.close()
+
+
+    #- - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - #
+    def write(self, context,
+                    file     = stdout,
+                    width    = None,
+                    no_color = False):
+        """
+        Write the stored help text of context to file. The text of the widest
+        stored width which fits into width is used (or of the narrowest, if
+        none of them fits).
+
+        Errors:
+            KeyError, if context is not in the help file
+        """
+        # Import python modules (only when the width is not given)
+        if width is None:
+            from shutil import get_terminal_size
+            width = get_terminal_size().columns
+
+        fitting = [stored for stored in self._widths if stored <= width]
+        width   = fitting[-1] if fitting else self._widths[0]
+        color   = not no_color and colors_available(file)
+        offset, size = self._index[context, width, color]
+        offset += self._start
+        text = self._map[offset:offset + size]
+
+        # Write bytes directly to the buffer of text streams
+        try:
+            buffer = file.buffer
+        except AttributeError:
+            file.write(text.decode())
+        else:
+            file.flush()
+            buffer.write(text)
+
+
+
+#------------------------------------------------------------------------------#
+def main(arguments):
+    # Import python modules (only when used from the command line)
+    from errno     import EINVAL
+    from importlib import import_module
+
+    try:
+        _, reference, path, *widths = arguments
+        module, _, attribute = reference.partition(':')
+        scheme = getattr(import_module(module), attribute)
+        widths = tuple(map(int, widths)) or WIDTHS
+    except (ValueError, ImportError, AttributeError) as error:
+        print(__doc__.strip(), error, sep='\n\n', file=stderr)
+        return EINVAL
+    build_help_file(scheme, path, widths)
+    return 0
+
+
+
+#------------------------------------------------------------------------------#
+if __name__ == '__main__':
+    exit(main(argv))
@@ -0,0 +1,98 @@
+## INFO ##
+## INFO ##
+
+# Import python modules
+from types       import MappingProxyType
+from threading   import Lock
+from collections import OrderedDict, namedtuple
+
+# Statistics of a Memo
+MemoInfo = namedtuple('MemoInfo', ('hits', 'misses', 'evictions',
+                                   'size', 'max_size'))
+
+
+
+#------------------------------------------------------------------------------#
+def freeze(patterns):
+    """
+    Returns an immutable copy of translated arguments: lists of members become
+    tuples, COMMON_ARRAY and UNIQUE_ARRAY values become tuples (in the same
+    order) and NAMED_VALUES become read-only mappings (compact Nodes are
+    copied as FrozenNodes, which cannot be modified)
+    """
+    frozen = []
+    for pattern in patterns:
+        name, value, members = pattern
+        if not (value is None or isinstance(value, (bool, str))):
+            if hasattr(value, 'items'):
+                value = MappingProxyType(value)
+            else:
+                value = tuple(value)
+        # Compact Nodes are kept as (immutable) Nodes
+        if isinstance(pattern, tuple):
+            frozen.append((name, value, freeze(members)))
+        else:
+            # Import argon modules (only when compact Nodes are frozen)
+            from argon.result import FrozenNode
+            frozen.append(FrozenNode(name, value, freeze(members)))
+    return tuple(frozen)
+
+
+
+#------------------------------------------------------------------------------#
+class Memo:
+    """
+    Bounded, least recently used cache of the frozen results of a parser,
+    keyed by the tuple of the parsed arguments. Errors are not cached.
+    """
+
+    #- - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - #
+    def __init__(self, max_size):
+        self._max_size  = max_size
+        self._results   = OrderedDict()
+        self._hits      = 0
+        self._misses    = 0
+        self._evictions = 0
+        # Lookups and updates of the cache can
+        # be done by more than one thread at once
+        self._lock      = Lock()
+
+
+    #- - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - #
+    def __call__(self, parse, arguments):
+        arguments = tuple(arguments)
+        results   = self._results
+        with self._lock:
+            try:
+                result = results[arguments]
+            except KeyError:
+                pass
+            else:
+                self._hits += 1
+                results.move_to_end(arguments)
+                return result
+
+        # Parse arguments outside of the lock, so other
+        # threads are not waiting for the parsing
+        result = freeze(parse(arguments))
+        with self._lock:
+            self._misses += 1
+            results[arguments] = result
+            results.move_to_end(arguments)
+            if len(results) > self._max_size:
+                results.popitem(last=False)
+                self._evictions += 1
+        return result
+
+
+    #- - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - #
+    def clear(self):
+        with self._lock:
+            self._results.clear()
+
+
+    #- - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - #
+    def info(self):
+        with self._lock:
+            return MemoInfo(self._hits, self._misses, self._evictions,
+                            len(self._results), self._max_size)
@@ -2,15 +2,10 @@
 ## INFO ##
 
 # Import python modules
-from itertools   import chain
-from collections import OrderedDict
-from string      import ascii_letters, digits
-
-# Import orderedset modules
-from orderedset  import OrderedSet
+from itertools import chain
 
 # Import argon modules
-from argon.text  import Section, Header, Paragraph, Flags
+from argon.text import Section, Header, Paragraph, Flags
 
 
 
@@ -76,8 +71,9 @@ class Pattern:
 
         members:
             A flag can have members, which means the flag becomes a `context`.
-            The argument takes string (as references to other Patterns) or
-            Pattern instances.
+            The argument takes string (as references to other Patterns),
+            Pattern instances or Lazy instances (references to Patterns, which
+            are only loaded when their flags are used first).
 
         member_type:
             This argument restricts how many members are allowed in the context
@@ -332,6 +328,8 @@ class Pattern:
 
         #- - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - #
         def __init__(self, name, flag, is_required):
+            # Import orderedset modules (only when it is used)
+            from orderedset import OrderedSet
             self._name        = name
             self._flag        = flag
             self._values      = OrderedSet()
@@ -356,6 +354,8 @@ class Pattern:
 
         #- - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - #
         def __init__(self, name, flag, is_required):
+            # Import python modules (only when it is used)
+            from collections import OrderedDict
             self._name        = name
             self._flag        = flag
             self._key         = NotImplemented
@@ -383,11 +383,14 @@ class Pattern:
 
     #- - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - #
     @staticmethod
-    def FLAG_VALIDATOR(string, valid_chars=set(ascii_letters + digits + '_-')):
-        if set(string) - valid_chars:
-            raise Pattern.InvalidFlagName(
-                'Flag name {!r} containes an '
-                'invalid character: {!r}'.format(string, char)) from None
+    def FLAG_VALIDATOR(string, valid_chars=set('abcdefghijklmnopqrstuvwxyz'
+                                               'ABCDEFGHIJKLMNOPQRSTUVWXYZ'
+                                               '0123456789_-')):
+        for char in string:
+            if char not in valid_chars:
+                raise Pattern.InvalidFlagName(
+                    'Flag name {!r} containes an '
+                    'invalid character: {!r}'.format(string, char)) from None
 
 
     # 'value_type-enums'
@@ -494,7 +497,28 @@ class Pattern:
     #- - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - #
     @property
     def description(self):
-        return self._description
+        description = self._description
+        # If description is constructed at its first use
+        if isinstance(description, str):
+            description = self._description = self._describe(description)
+            description.owner = self
+        return description
+
+
+    #- - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - #
+    def _describe(self, description):
+        # Construct default description from string
+        value_type = self._object_hook
+        if value_type is Pattern.STATE_SWITCH:
+            usage = ''
+        else:
+            usage = {Pattern.SINGLE_VALUE: '<value>',
+                     Pattern.COMMON_ARRAY: '<value>...',
+                     Pattern.UNIQUE_ARRAY: '<value>...',
+                     Pattern.NAMED_VALUES: '<key> <value>...'}[value_type]
+            if not self._value_necessity:
+                usage = '[' + usage + ']'
+        return Section(Flags(usage), Paragraph(description))
 
 
     #- - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - #
@@ -563,10 +587,6 @@ class Pattern:
             raise ValueError("'value_necessity' has to be Pattern.OPTIONAL or "
                              "Pattern.REQUIRED, not: {!r}".format(value_necessity))
         self._value_necessity = value_necessity
-        if value_necessity:
-            necessity = lambda s: s
-        else:
-            necessity = lambda s: '[' + s + ']'
 
         # Check and store member_type
         if member_type not in Pattern.__MEMBER_TYPE:
@@ -586,19 +606,13 @@ class Pattern:
                              "Pattern.REQUIRED, not: {!r}".format(member_necessity))
         self._member_necessity = member_necessity
 
-        # Check and store description
-        if isinstance(description, str):
-            description = Section(
-                Flags({Pattern.STATE_SWITCH: '',
-                       Pattern.SINGLE_VALUE: necessity('<value>'),
-                       Pattern.COMMON_ARRAY: necessity('<value>...'),
-                       Pattern.UNIQUE_ARRAY: necessity('<value>...'),
-                       Pattern.NAMED_VALUES: necessity('<key> <value>...')}[value_type]),
-                Paragraph(description))
-        elif not isinstance(description, Section):
+        # Check and store description (if it is a string, the Section
+        # is only constructed when the description is used first)
+        if isinstance(description, Section):
+            description.owner = self
+        elif not isinstance(description, str):
             raise TypeError("'description' expected str or argon.text.Section, "
                             "got: {.__class__.__qualname__!r}".format(description))
-        description.owner = self
         self._description = description
 
         # Check and store double-dash value
@@ -652,17 +666,110 @@ class Program(Pattern):
         # If otherwise not specified set flag_validator to accept file names
         kwargs.setdefault('flag_validator', Program.ACCEPT_ANYTHING)
 
-        # Create basic documentation
-        description = kwargs.get('description', '')
-        if isinstance(description, str):
-            kwargs['description'] = Section(
-                Header('NAME'),
-                Paragraph(long_flag +
-                               ((' - ' + description) if description else '')))
-
         # Set default values if they are not already defined by the user
         kwargs.setdefault('long_prefix', '')
         kwargs.setdefault('flag_type', Pattern.UNIQUE)
 
         # Initialize Pattern
         super().__init__(long_flag, *args, **kwargs)
+
+
+    #- - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - #
+    def _describe(self, description):
+        # Create basic documentation
+        return Section(Header('NAME'),
+                       Paragraph(self._name +
+                                 ((' - ' + description) if description else '')))
+
+
+
+#------------------------------------------------------------------------------#
+class Lazy:
+    """
+    Lazy reference of a member pattern. The pattern is only loaded by the
+    Scheme, when one of its flags is used for the first time. (Or when the
+    help text of its context is written.) If it is passed to the Scheme
+    itself, it is a top-level pattern (e.g. a Program), which is only loaded
+    when its flag (or the path of the program, e.g. argv[0]) is used.
+
+    ARGUMENTS:
+
+        long_flag:
+            The name of the referenced Pattern.
+
+        loader:
+            A '<module>:<attribute>' reference or a callable. The referenced
+            attribute (or the value returned by the callable, if it is callable
+            as well) is either the Pattern itself, or an iterable of Patterns,
+            one of them is the referenced Pattern, and the others are the
+            patterns of its members, which are not part of the Scheme yet.
+
+        flags:
+            The flags of the referenced Pattern. By default it is the
+            long_flag only (without any prefices), as subcommands are used.
+    """
+
+    #- - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - #
+    def __init__(self, long_flag, loader, flags=None):
+        self._name     = long_flag
+        self._loader   = loader
+        self._flags    = tuple(flags) if flags else (long_flag,)
+        self._patterns = None
+
+
+    #- - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - #
+    @property
+    def name(self):
+        return self._name
+
+
+    #- - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - #
+    @property
+    def long_flag(self):
+        return self._flags[0]
+
+
+    #- - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - #
+    @property
+    def flags(self):
+        yield from self._flags
+
+
+    #- - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - #
+    @property
+    def loader(self):
+        return self._loader
+
+
+    #- - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - #
+    def load(self):
+        """
+        Returns the loaded Patterns in a tuple, the loader is only called once
+
+        Errors:
+            ImportError and AttributeError, if the reference cannot be
+            imported, and ValueError, if the referenced Pattern is not loaded
+        """
+        if self._patterns is None:
+            loader = self._loader
+            if isinstance(loader, str):
+                # Import python modules (only when a reference is loaded)
+                from importlib import import_module
+                module, _, attribute = loader.partition(':')
+                loader = getattr(import_module(module), attribute)
+            if callable(loader):
+                loader = loader()
+            patterns = (loader,) if isinstance(loader, Pattern) else tuple(loader)
+            for pattern in patterns:
+                if pattern.name == self._name:
+                    break
+            else:
+                raise ValueError('Pattern {!r} is not loaded by: '
+                                 '{!r}'.format(self._name, self._loader))
+            self._patterns = patterns
+        return self._patterns
+
+
+    #- - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - #
+    def __repr__(self):
+        return 'Lazy({!r}, {!r})'.format(self._name, self._loader)
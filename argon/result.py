@@ -0,0 +1,163 @@
+## INFO ##
+## INFO ##
+
+
+#------------------------------------------------------------------------------#
+class Node:
+    """
+    Compact translated pattern. It can be used the same way as the
+    (<long_flag>, <value>, [<member(s)>]) tuples (unpacked or indexed), but
+    it uses less memory, and its members are stored in a tuple, which is the
+    shared empty tuple if the pattern has no members.
+    """
+
+    __slots__ = ('name', 'value', 'members')
+
+    #- - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - #
+    def __init__(self, name, value, members):
+        self.name    = name
+        self.value   = value
+        self.members = members
+
+
+    #- - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - #
+    def __iter__(self):
+        return iter((self.name, self.value, self.members))
+
+
+    #- - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - #
+    def __getitem__(self, index):
+        return (self.name, self.value, self.members)[index]
+
+
+    #- - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - #
+    def __len__(self):
+        return 3
+
+
+    #- - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - #
+    def __eq__(self, other):
+        # Nodes are equal to the same tuples (with lists of members)
+        try:
+            name, value, members = other
+        except (TypeError, ValueError):
+            return NotImplemented
+        return (self.name  == name  and
+                self.value == value and
+                tuple(self.members) == tuple(members))
+
+
+    #- - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - #
+    def __repr__(self):
+        return 'Node({!r}, {!r}, {!r})'.format(self.name,
+                                               self.value,
+                                               self.members)
+
+
+
+#------------------------------------------------------------------------------#
+class FrozenNode(Node):
+    """
+    Immutable Node, which is used by the memoized results, as those are
+    returned to every caller of the same arguments
+    """
+
+    __slots__ = ()
+
+    #- - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - #
+    def __init__(self, name, value, members):
+        object.__setattr__(self, 'name',    name)
+        object.__setattr__(self, 'value',   value)
+        object.__setattr__(self, 'members', members)
+
+
+    #- - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - #
+    def __setattr__(self, name, value):
+        raise AttributeError('FrozenNode cannot be modified')
+
+
+    #- - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - #
+    def __delattr__(self, name):
+        raise AttributeError('FrozenNode cannot be modified')
+
+
+    #- - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - #
+    def __reduce__(self):
+        # Copied and pickled by the arguments of __init__ (the
+        # default would set the slots one by one after creation)
+        return FrozenNode, (self.name, self.value, self.members)
+
+
+
+#------------------------------------------------------------------------------#
+def compact(patterns):
+    """
+    Returns the translated arguments as a tuple of Nodes
+    """
+    return tuple(Node(name, value, compact(members) if members else ())
+                 for name, value, members in patterns)
+
+
+
+#------------------------------------------------------------------------------#
+class Query:
+    """
+    Index of translated arguments, which is built in a single pass, and which
+    finds the translated patterns in constant time by their long flags, or by
+    their context paths, e.g. ('app', '--build', '--output'). Each translated
+    pattern is a (<long_flag>, <value>, [<member(s)>]) tuple or a Node.
+    """
+
+    #- - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - #
+    def __init__(self, patterns, long_flags):
+        self._patterns = patterns
+        self._by_flag  = by_flag = {}
+        self._by_path  = by_path = {}
+        # Walk the translated patterns in the order of the arguments
+        stack = [((), pattern) for pattern in reversed(patterns)]
+        while stack:
+            path, pattern = stack.pop()
+            path += (long_flags[pattern[0]],)
+            by_flag.setdefault(path[-1], []).append(pattern)
+            by_path.setdefault(path, []).append(pattern)
+            stack.extend((path, member) for member in reversed(pattern[2]))
+
+
+    #- - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - #
+    @property
+    def patterns(self):
+        return self._patterns
+
+
+    #- - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - #
+    def __contains__(self, long_flag):
+        return long_flag in self._by_flag
+
+
+    #- - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - #
+    def get(self, long_flag, default=None):
+        """
+        Returns the first translated pattern of long_flag, or default
+        """
+        try:
+            return self._by_flag[long_flag][0]
+        except KeyError:
+            return default
+
+
+    #- - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - #
+    def all(self, long_flag):
+        """
+        Returns all translated patterns of long_flag in the order of the
+        arguments (more than one is only possible for COMMON patterns)
+        """
+        return tuple(self._by_flag.get(long_flag, ()))
+
+
+    #- - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - #
+    def at(self, path):
+        """
+        Returns all translated patterns of the context path (a sequence of
+        long flags, starting with the program) in the order of the arguments
+        """
+        return tuple(self._by_path.get(tuple(path), ()))
@@ -2,28 +2,22 @@
 ## INFO ##
 
 # Import python modules
-from itertools     import chain
-from sys           import stdout, stderr
-from re            import compile, split
-from shutil        import get_terminal_size
-
-# Import dagger modules
-from dagger.graph  import Graph
-from dagger.tools  import topo_sort, a_star, DAGCycleError
+from sys import stdout, stderr
 
 # Import argon modules
-from argon.text    import Section
-from argon.pattern import Pattern
+from argon.text    import Section, colors_available
+from argon.pattern import Pattern, Lazy
 
+# Number of the rendered help texts cached by a Scheme
+HELP_CACHE_SIZE = 32
 
 #------------------------------------------------------------------------------#
 class Scheme:
 
     #- - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - #
     # Internal errors
-    class _ContextFound(Exception)          : pass
-    class _CloseCurrentPattern(Exception)   : pass
-    class _FlagAndValueSeparated(Exception) : pass
+    class _ContextFound(Exception)        : pass
+    class _CloseCurrentPattern(Exception) : pass
 
 
     #- - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - #
@@ -42,43 +36,264 @@ class Scheme:
     class MissingMember(SchemeException)          : pass
 
 
+    # 'event-enums' of iter_events
+    (OPEN,
+     VALUE,
+     CLOSE,
+     ERROR) = range(4)
+
+
+    #- - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - #
+    # Internal object hook of iter_events, which checks the values of a pattern
+    # the same way as the object hooks of Pattern, but instead of collecting
+    # them, it returns each value which has to be yielded (or NotImplemented)
+    class _StreamedValues:
+
+        def __init__(self, object_hook, flag, is_required):
+            self._hook        = object_hook
+            self._flag        = flag
+            self._is_required = is_required
+            self._count       = 0
+            self._key         = NotImplemented
+            # UNIQUE_ARRAY has to remember the values already
+            # seen, therefore its memory grows with its values
+            self._seen = set() if object_hook is Pattern.UNIQUE_ARRAY else None
+
+        def add_value(self, value):
+            hook = self._hook
+            if (hook is Pattern.STATE_SWITCH or
+                (hook is Pattern.SINGLE_VALUE and self._count)):
+                    raise Pattern.FinishedPattern(hook, self._flag, value)
+            if hook is Pattern.NAMED_VALUES:
+                if self._key is NotImplemented:
+                    self._key = value
+                    return NotImplemented
+                value     = self._key, value
+                self._key = NotImplemented
+            elif self._seen is not None:
+                if value in self._seen:
+                    return NotImplemented
+                self._seen.add(value)
+            self._count += 1
+            return value
+
+        def close(self, name, flag):
+            if (self._key is not NotImplemented or
+                (self._is_required and
+                 not self._count and
+                 self._hook is not Pattern.STATE_SWITCH)):
+                    raise Pattern.UnfinishedPattern(
+                        self._hook, self._flag,
+                        Pattern.EOL() if name is NotImplemented else flag)
+
+
     #- - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - #
-    # Internal branch-builder recursive helper function
+    # Internal prefix-index builder helper function
     @staticmethod
-    def _branch(parent):
-        branch = {}
-        for child in parent.vertices():
-            branch[child.id] = Scheme._branch(child)
-        return branch
+    def _index(patterns, flag_groupable  = None,
+                         value_immediate = None,
+                         value_delimiter = None):
+        # Each node of the trie is a dictionary of characters, and if a flag
+        # ends at a node, the '' key stores its pattern's splitting options
+        # (options of the scheme override the options of the patterns)
+        index = {}
+        for order, pattern in enumerate(patterns):
+            Scheme._insert(index, order, pattern, flag_groupable,
+                                                  value_immediate,
+                                                  value_delimiter)
+        return index
+
+
+    #- - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - #
+    # Internal prefix-index helper function, which adds the flags of a pattern
+    @staticmethod
+    def _insert(index, order, pattern, flag_groupable,
+                                       value_immediate,
+                                       value_delimiter):
+        delimiter = (pattern.value_delimiter if value_delimiter is None
+                     else value_delimiter)
+        groupable = (pattern.flag_groupable if flag_groupable is None
+                     else flag_groupable)
+        immediate = (pattern.value_immediate if value_immediate is None
+                     else value_immediate)
+        # If flags of pattern cannot be joined with anything
+        if not (delimiter or groupable or immediate):
+            return
+        prefices = tuple(pattern.prefices)
+        for flag in pattern.flags:
+            node = index
+            for char in flag:
+                node = node.setdefault(char, {})
+            node[''] = order, delimiter, groupable, immediate, prefices
+
+
+    #- - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - #
+    # Internal prefix-index helper function, which removes the flags of a
+    # pattern, and the nodes of the trie which are not used by other flags
+    @staticmethod
+    def _delete(index, pattern):
+        for flag in pattern.flags:
+            path = []
+            node = index
+            for char in flag:
+                try:
+                    path.append((node, char))
+                    node = node[char]
+                except KeyError:
+                    break
+            else:
+                node.pop('', None)
+                while path and not node:
+                    node, char = path.pop()
+                    del node[char]
+
+
+    #- - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - #
+    def _split(self, argument):
+        """
+        Returns:
+
+            (<flag>, <value>) or None
+        """
+        node  = self._prefix_index
+        found = rank = None
+        # Walk the trie along the argument, and check every flag which is a
+        # prefix of it (patterns are prioritised in their declaration order,
+        # then delimited values, grouped flags and immediate values follow)
+        for length, char in enumerate(argument, start=1):
+            try:
+                node = node[char]
+            except KeyError:
+                break
+            try:
+                order, delimiter, groupable, immediate, prefices = node['']
+            except KeyError:
+                continue
+            # If a better candidate has already been found
+            if rank is not None and rank[0] <= order:
+                continue
+            flag = argument[:length]
+            rest = argument[length:]
+            # If flag and value are separated by the delimiter of the pattern
+            if (delimiter and
+                rest.startswith(delimiter) and
+                len(rest) > len(delimiter)):
+                    found = flag, rest[len(delimiter):]
+                    rank  = order, 0
+                    continue
+            # If flag is grouped with other flags
+            if groupable:
+                for prefix in prefices:
+                    if argument.startswith(prefix):
+                        break
+                else:
+                    prefix = None
+                if prefix is not None:
+                    found = flag, prefix + rest
+                    rank  = order, 1
+                    continue
+            # If value follows the flag immediately
+            if immediate and rest:
+                found = flag, rest
+                rank  = order, 2
+        return found
 
 
     #- - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - #
     def __init__(self, *pattern_objects,
                         flag_groupable  = None,
                         value_immediate = None,
-                        value_delimiter = None):
-        # Create graphs (forward and reversed)
-        fgraph = Graph()
-        rgraph = Graph()
-
-        # Create a flat map of all patterns, and
-        # a flag map (associate all flags with all patterns), and
-        # a graph all patterns, to build context hierarchy
-        self._flags    = flags    = {}
+                        value_delimiter = None,
+                        cache           = False,
+                        memoize         = None,
+                        compact         = False):
+        # Create a flat map of all patterns (and of the lazy programs)
         self._patterns = patterns = {}
+        programs = {}
         for pattern in pattern_objects:
-            if pattern.name in patterns:
+            if pattern.name in patterns or pattern.name in programs:
                 raise Scheme.LongFlagIsNotUnique(
                     'Long flag is used more than once: '
                     '{!r}'.format(pattern.name))
-            patterns[pattern.name] = pattern
-            # Set global options
-            if flag_groupable is not None:
-                pattern.flag_groupable = flag_groupable
-            if value_immediate is not None:
-                pattern.value_immediate = value_immediate
-            if value_delimiter is not None:
-                pattern.value_delimiter = value_delimiter
+            if isinstance(pattern, Lazy):
+                programs[pattern.name] = pattern
+            else:
+                patterns[pattern.name] = pattern
+
+        # Global options, which override the options of the patterns in this
+        # scheme only (patterns are not changed, so they can be shared)
+        self._options = flag_groupable, value_immediate, value_delimiter
+
+        # Flag dispatch table of the compiled parser
+        self._dispatch = None
+
+        # Rendered help texts of write_help, and
+        # the blocks of the help texts of contexts
+        self._help     = {}
+        self._contexts = {}
+        self._order    = None
+
+        # Parents of the patterns (see add_pattern and remove_pattern), and
+        # the order of the next added pattern in the prefix index
+        self._parents = None
+        self._serial  = len(patterns)
+
+        # Lazy members and programs, which are not loaded yet (by their names),
+        # the lazy members of the contexts, the names of the lazy members and
+        # programs by their flags, and the lock of the loading
+        self._lazy       = {}
+        self._deferred   = {}
+        self._lazy_flags = {}
+        self._lock       = None
+
+        # Long flags of the members of the patterns (by their names)
+        self._member_flags = {}
+        for program in programs.values():
+            self._defer(None, program)
+        for pattern in patterns.values():
+            for member in pattern._members:
+                if (isinstance(member, Lazy) and
+                    member.name not in patterns):
+                        self._defer(pattern.name, member)
+
+        # If results should be returned as compact Nodes
+        self._compact = compact
+
+        # If results should be memoized (in a cache of memoize size)
+        if memoize:
+            # Import argon modules (only when memoization is used)
+            from argon.memo import Memo
+            self._memo = Memo(memoize)
+        else:
+            self._memo = None
+
+        # If compiled scheme should be cached
+        if cache:
+            # Import argon modules (only when caching is used)
+            from argon.cache import (fingerprint,
+                                     read_cache,
+                                     write_cache,
+                                     cache_directory)
+            directory = cache_directory() if cache is True else cache
+            key = fingerprint(patterns.values(), self._options)
+            # If scheme has already been compiled and cached
+            data = read_cache(directory, key)
+            if data is not None:
+                self._load(data)
+                return
+
+        # Import dagger modules (only when the scheme is built)
+        from dagger.graph import Graph
+        from dagger.tools import topo_sort, DAGCycleError
+
+        # Create graphs (forward and reversed)
+        fgraph = Graph()
+        rgraph = Graph()
+
+        # Create a flag map (associate all flags with all patterns), and
+        # a graph all patterns, to build context hierarchy
+        self._flags = flags = {}
+        for pattern in patterns.values():
             # Add pattern to graph
             fgraph.add_vertex(pattern.name)
             rgraph.add_vertex(pattern.name)
@@ -89,27 +304,42 @@ class Scheme:
                         '{!r}'.format(flag))
                 flags[flag] = pattern
 
+        # Create the nodes of the context hierarchy: every pattern has exactly
+        # one node (a dictionary of the nodes of its members), which is shared
+        # by all of its parents, so the hierarchy is a DAG instead of a tree
+        self._nodes = nodes = {name: {} for name in patterns}
+
         # Build graph edges
         for name, pattern in patterns.items():
             # If pattern is a context, create edges to its members
             for member in pattern._members:
                 # If member is an Pattern instance
                 if isinstance(member, Pattern):
-                    fgraph.add_edge(name, member.name)
-                    rgraph.add_edge(member.name, name)
+                    member = member.name
+                    nodes.setdefault(member, {})
+                # If member is a Lazy instance
+                elif isinstance(member, Lazy):
+                    # If member is not loaded yet
+                    if member.name not in patterns:
+                        continue
+                    member = member.name
                 # If member is a string-name reference
                 elif isinstance(member, str):
                     # If member is not a real reference
                     if member not in patterns:
                         raise Scheme.InvalidMemberReference(member)
-                    fgraph.add_edge(name, member)
-                    rgraph.add_edge(member, name)
                 # If member is not a Pattern nor a string
                 else:
                     raise Scheme.InvalidPatternMember(
                         "Type of members of Pattern {!r} "
                         "should be 'str' or 'Pattern' not "
                         "{.__class__.__qualname__!r}".format(name, member))
+                fgraph.add_edge(name, member)
+                rgraph.add_edge(member, name)
+                nodes[name][member] = nodes[member]
+
+        # Build prefix index of the flags which can be joined with values
+        self._prefix_index = Scheme._index(patterns.values(), *self._options)
 
         # Build context hierarchy
         self._hierarchy = hierarchy = {}
@@ -117,12 +347,327 @@ class Scheme:
             for vertex in topo_sort(fgraph, tracking=True):
                 # If vertex doesn't have parent(s)
                 if not rgraph.vertex(vertex.id).vertices():
-                    # Build its branch
-                    hierarchy[vertex.id] = Scheme._branch(vertex)
+                    # Make its node a top-level context
+                    hierarchy[vertex.id] = nodes[vertex.id]
         # If there are circular references in the graph
         except DAGCycleError as message:
             raise Scheme.CircularReferences(message.args) from None
 
+        # If compiled scheme should be cached
+        if cache:
+            write_cache(directory, key, self.compile()._dump())
+
+
+    #- - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - #
+    def _parent_index(self):
+        # Parents of the patterns are only collected when
+        # the scheme is changed for the first time
+        if self._parents is None:
+            self._parents = parents = {name: set() for name in self._nodes}
+            for name, node in self._nodes.items():
+                for member in node:
+                    parents[member].add(name)
+        return self._parents
+
+
+    #- - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - #
+    def _check_member(self, context, member, search=True):
+        # If member is a Pattern instance (or a loaded Lazy instance)
+        if isinstance(member, (Pattern, Lazy)):
+            member = member.name
+        # If member is a string-name reference
+        elif isinstance(member, str):
+            # If member is not a real reference
+            if member not in self._patterns:
+                raise Scheme.InvalidMemberReference(member)
+        # If member is not a Pattern nor a string
+        else:
+            raise Scheme.InvalidPatternMember(
+                "Type of members of Pattern {!r} "
+                "should be 'str' or 'Pattern' not "
+                "{.__class__.__qualname__!r}".format(context, member))
+        if member == context:
+            raise Scheme.CircularReferences(
+                '{!r} is a member of itself'.format(context))
+        # Only the patterns below member are visited, to find out if context
+        # is one of them, which would make member a context of itself
+        nodes   = self._nodes
+        stack   = [member] if search else []
+        visited = {member}
+        while stack:
+            name = stack.pop()
+            if name == context:
+                raise Scheme.CircularReferences(
+                    '{!r} is a member of {!r}'.format(context, member))
+            for name in nodes.get(name, ()):
+                if name not in visited:
+                    visited.add(name)
+                    stack.append(name)
+        return member
+
+
+    #- - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - #
+    def _member_long_flags(self, name):
+        # Returns the long flags of the members of the pattern called name
+        # (members which are not loaded yet are included)
+        try:
+            return self._member_flags[name]
+        except KeyError:
+            pass
+        # If members can be loaded by other threads meanwhile
+        if self._lock is not None:
+            with self._lock:
+                return self._update_member_flags(name)
+        return self._update_member_flags(name)
+
+
+    #- - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - #
+    def _update_member_flags(self, name):
+        patterns = self._patterns
+        flags    = (tuple(patterns[m].long_flag for m in self._nodes[name]) +
+                    tuple(m.long_flag
+                          for m in self._deferred.get(name, {}).values()))
+        self._member_flags[name] = flags
+        return flags
+
+
+    #- - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - #
+    def _changed(self, names):
+        # Update the long flags of the members of the changed patterns (other
+        # threads only read these, they never iterate over changing nodes)
+        for name in names:
+            self._update_member_flags(name)
+        # Update the records of the changed patterns if scheme is compiled
+        dispatch = self._dispatch
+        if dispatch is not None:
+            for name in names:
+                record = self._record(name)
+                for flag in self._patterns[name].flags:
+                    dispatch[flag] = record
+        # Drop everything which has been derived from the old scheme
+        self._help     = {}
+        self._contexts = {}
+        self._order    = None
+        if self._memo is not None:
+            self._memo.clear()
+
+
+    #- - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - #
+    def _defer(self, context, lazy):
+        # Import python modules (only when members are loaded lazily)
+        if self._lock is None:
+            from threading import Lock
+            self._lock = Lock()
+        self._lazy.setdefault(lazy.name, lazy)
+        # If lazy pattern is not a top-level pattern (program)
+        if context is not None:
+            self._deferred.setdefault(context, {})[lazy.name] = lazy
+        for flag in lazy.flags:
+            self._lazy_flags[flag] = lazy.name
+
+
+    #- - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - #
+    def _load_lazy(self, argument):
+        # Returns True if argument is the flag of a lazy member or program,
+        # which is loaded, if it has not been loaded yet, or if it has been
+        # loaded by another thread since argument was looked up. (Only exact
+        # flags are loaded, so values starting with flags are not loading
+        # anything, and flags of lazy members cannot be joined with values,
+        # until they are loaded.)
+        try:
+            name = self._lazy_flags[argument]
+        except KeyError:
+            return argument in self._flags
+        with self._lock:
+            self._load_member(name)
+        return True
+
+
+    #- - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - #
+    def _program(self, argument):
+        # Returns the name of the top-level pattern (program), which is
+        # selected by the file name of the path of argument (e.g. argv[0]),
+        # or None, if argument is not a path of any program
+        # Import python modules (only when a path is used)
+        from os.path import basename
+        name = basename(argument)
+        if name == argument:
+            return None
+        if name not in self._flags and self._lazy_flags:
+            self._load_lazy(name)
+        try:
+            if self._flags[name].name in self._hierarchy:
+                return name
+        except KeyError:
+            pass
+        return None
+
+
+    #- - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - #
+    def _load_members(self, context=None):
+        # Load the lazy members of context (or all of them, if context is None,
+        # including the ones which are members of the loaded patterns)
+        while True:
+            names = tuple(self._lazy if context is None
+                          else self._deferred.get(context, ()))
+            if not names:
+                return
+            with self._lock:
+                for name in names:
+                    self._load_member(name)
+
+
+    #- - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - #
+    def _load_member(self, name):
+        # If member has already been loaded
+        try:
+            lazy = self._lazy[name]
+        except KeyError:
+            return
+        # Add the loaded patterns, which are not in the scheme yet, after
+        # the patterns of their members, if those are loaded as well
+        pending = [p for p in lazy.load() if p.name not in self._patterns]
+        loaded  = {p.name for p in pending}
+        while pending:
+            waiting = []
+            for pattern in pending:
+                if any((m if isinstance(m, str) else getattr(m, 'name', None))
+                       in loaded - self._patterns.keys()
+                       for m in pattern._members):
+                    waiting.append(pattern)
+                else:
+                    self.add_pattern(pattern)
+            if len(waiting) == len(pending):
+                raise Scheme.CircularReferences(
+                    'Loaded patterns are members of each other: '
+                    '{}'.format(', '.join(repr(p.name) for p in waiting)))
+            pending = waiting
+        # Make the loaded pattern a member of its contexts
+        for context, deferred in tuple(self._deferred.items()):
+            if deferred.pop(name, None) is not None:
+                if not deferred:
+                    del self._deferred[context]
+                self.add_member(context, name)
+        # Flags are removed after the pattern has been added, so
+        # other threads are either finding the flag or the pattern
+        for flag in lazy.flags:
+            self._lazy_flags.pop(flag, None)
+        del self._lazy[name]
+
+
+    #- - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - #
+    def add_pattern(self, pattern):
+        """
+        Add pattern to the scheme, which becomes a top-level context. Only the
+        flags and members of pattern are processed, and the rest of the
+        scheme is not rebuilt.
+
+        Errors:
+            The same as the errors of building the Scheme
+        """
+        name = pattern.name
+        if name in self._patterns:
+            raise Scheme.LongFlagIsNotUnique(
+                'Long flag is used more than once: {!r}'.format(name))
+        flags = self._flags
+        for flag in pattern.flags:
+            if flag in flags:
+                raise Scheme.ShortFlagIsNotUnique(
+                    'Short flag is used more than once: {!r}'.format(flag))
+        # A new pattern cannot be a member of any other pattern (unless it has
+        # been referenced as a Pattern instance), so it cannot be in a cycle
+        search  = bool(self._parent_index().get(name))
+        lazy    = [m for m in pattern._members
+                   if isinstance(m, Lazy) and m.name not in self._patterns]
+        members = [self._check_member(name, m, search)
+                   for m in pattern._members if m not in lazy]
+
+        parents = self._parent_index()
+        nodes   = self._nodes
+        node    = nodes.setdefault(name, {})
+        parents.setdefault(name, set())
+        self._patterns[name] = pattern
+        for flag in pattern.flags:
+            flags[flag] = pattern
+        for member in members:
+            node[member] = nodes.setdefault(member, {})
+            parents.setdefault(member, set()).add(name)
+            # Member is not a top-level context anymore
+            self._hierarchy.pop(member, None)
+        if not parents[name]:
+            self._hierarchy[name] = node
+        for member in lazy:
+            self._defer(name, member)
+
+        Scheme._insert(self._prefix_index, self._serial, pattern, *self._options)
+        self._serial += 1
+        self._changed((name,))
+
+
+    #- - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - #
+    def remove_pattern(self, name):
+        """
+        Remove the pattern called name from the scheme, and from all of its
+        contexts. Its members, which are not members of other contexts,
+        become top-level contexts.
+
+        Errors:
+            KeyError, if there is no pattern called name in the scheme
+        """
+        pattern = self._patterns.pop(name)
+        parents = self._parent_index()
+        nodes   = self._nodes
+        for flag in pattern.flags:
+            del self._flags[flag]
+        for member in nodes[name]:
+            parents[member].discard(name)
+            # If member is not a member of anything else
+            if not parents[member]:
+                self._hierarchy[member] = nodes[member]
+        contexts = parents.pop(name)
+        for context in contexts:
+            del nodes[context][name]
+        del nodes[name]
+        self._hierarchy.pop(name, None)
+        self._deferred.pop(name, None)
+        self._member_flags.pop(name, None)
+
+        Scheme._delete(self._prefix_index, pattern)
+        if self._dispatch is not None:
+            for flag in pattern.flags:
+                del self._dispatch[flag]
+        self._changed(contexts)
+
+
+    #- - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - #
+    def add_member(self, context, member):
+        """
+        Make member (a name or a Pattern of the scheme) a member of the pattern
+        called context. Only the patterns below member are checked for
+        circular references.
+
+        Errors:
+            KeyError, if there is no pattern called context in the scheme
+            Scheme.InvalidMemberReference, Scheme.InvalidPatternMember and
+            Scheme.CircularReferences, the same as when building the Scheme
+        """
+        if context not in self._patterns:
+            raise KeyError(context)
+        # If member is a Lazy instance, which is not loaded yet
+        if (isinstance(member, Lazy) and
+            member.name not in self._patterns):
+                self._defer(context, member)
+                self._changed((context,))
+                return
+        node   = self._nodes[context]
+        member = self._check_member(context, member)
+        if member in node:
+            return
+        node[member] = self._nodes[member]
+        self._parent_index()[member].add(context)
+        self._hierarchy.pop(member, None)
+        self._changed((context,))
+
 
     #- - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - #
     def _parse_iter(self, arguments):
@@ -155,7 +700,12 @@ class Scheme:
         flags         = self._flags
         patterns      = self._patterns
         hierarchy     = self._hierarchy
+        # If there are lazy members or programs, which are not loaded yet
+        # (they are looked up until the end of parsing, even if they are
+        # loaded by other threads meanwhile)
+        lazy          = bool(self._lazy_flags)
         arguments     = iter(arguments)
+        pushed_back   = []
         context       = hierarchy
         contexts      = []
         context_path  = []
@@ -176,8 +726,11 @@ class Scheme:
         while True:
             # If any unprocessed arguments left
             try:
-                # Get next argument
-                argument = next(arguments)
+                # Get next argument (pushed back arguments come first)
+                if pushed_back:
+                    argument = pushed_back.pop()
+                else:
+                    argument = next(arguments)
                 # Get pattern object associated with flag (argument)
                 try:
                     pattern = flags[argument]
@@ -190,41 +743,39 @@ class Scheme:
                         unique_flags.add(pattern.name)
                 # If no pattern found
                 except KeyError:
+                    # If flag is a lazy member, which has just been loaded
+                    if (lazy and
+                        self._load_lazy(argument) and
+                        argument in flags):
+                            pushed_back.append(argument)
+                            continue
                     # If flag and value has no separation, or
                     # flag and value has a specific separation
-                    try:
-                        for pattern in patterns.values():
-                            # If pattern defines a separator between flag and value
-                            if pattern.value_delimiter:
-                                flag, _, value = argument.partition(pattern.value_delimiter)
-                                if flag and value:
-                                    raise Scheme._FlagAndValueSeparated
-                            # If pattern can be grouped
-                            if pattern.flag_groupable:
-                                for flag in pattern.flags:
-                                    if argument.startswith(flag):
-                                        for prefix in pattern.prefices:
-                                            if argument.startswith(prefix):
-                                                value = prefix + argument[len(flag):]
-                                                raise Scheme._FlagAndValueSeparated
-                            # If pattern allows no separation between flag and value
-                            if pattern.value_immediate:
-                                for flag in pattern.flags:
-                                    if argument.startswith(flag):
-                                        value = argument[len(flag):]
-                                        raise Scheme._FlagAndValueSeparated
-
-                    # If flag and value separated, start cycle again
-                    except Scheme._FlagAndValueSeparated:
-                        arguments = chain((flag, value), arguments)
+                    separated = self._split(argument)
+                    # If flag and value separated, push them back
+                    # (in reversed order) and start cycle again
+                    if separated:
+                        flag, value = separated
+                        pushed_back.append(value)
+                        pushed_back.append(flag)
                         continue
+                    # If argument is the path of a program (e.g. argv[0])
+                    if curr_values is None:
+                        program = self._program(argument)
+                        if program is not None:
+                            pushed_back.append(program)
+                            continue
 
                     # If there is an open pattern waiting for values
                     try:
                         # If current argument indicates the end of the
                         # "traditional" arguments list
-                        if argument == pattern.double_dash:
+                        double_dash = patterns[curr_values.name].double_dash
+                        if (double_dash and
+                            argument == double_dash):
                             # Process all arguments left
+                            while pushed_back:
+                                curr_values.add_value(pushed_back.pop())
                             for argument in arguments:
                                 curr_values.add_value(argument)
                         else:
@@ -274,7 +825,7 @@ class Scheme:
                             if pattern.member_necessity == Pattern.REQUIRED:
                                 need_members = \
                                     (argument,
-                                     [patterns[m].long_flag for m in pattern.members])
+                                     list(self._member_long_flags(name)))
                             # If this pattern can be followed by "anything"
                             else:
                                 need_members = False
@@ -371,11 +922,287 @@ class Scheme:
                          processed)]
 
 
+    #- - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - #
+    def compile(self):
+        """
+        Precompute the flag dispatch table used by the table-driven parser.
+        After compilation parse_iter, parse_args and parse_line will walk these
+        tables instead of the original, exception-driven state machine.
+
+        Each flag will be associated with a record:
+
+            (<name>, <flag_type>, <member_type is ONE>,
+             <member_necessity is REQUIRED>, <object_hook>, <value_necessity>,
+             <double_dash>, <hierarchy node>, (<long_flag of member>, ...))
+
+        Returns:
+
+            self
+        """
+        records = {name: self._record(name) for name in self._patterns}
+        self._roots    = self._hierarchy
+        self._dispatch = {flag: records[pattern.name]
+                          for flag, pattern in self._flags.items()}
+        return self
+
+
+    #- - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - #
+    def _record(self, name):
+        # Members are the members of the node of the pattern in the hierarchy,
+        # which can be changed after the scheme has been built (see add_member)
+        pattern = self._patterns[name]
+        return (name,
+                pattern.flag_type,
+                pattern.member_type == Pattern.ONE,
+                pattern.member_necessity == Pattern.REQUIRED,
+                pattern.object_hook,
+                pattern.value_necessity,
+                pattern.double_dash,
+                self._nodes[name],
+                self._member_long_flags(name))
+
+
+    #- - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - #
+    def generate_module(self, path):
+        """
+        Write a standalone parser module of this scheme to path, which does not
+        depend on argon (see argon.generator for details)
+        """
+        # Import argon modules (only when a module is generated)
+        from argon.generator import generate_module
+        # Generated module cannot load anything lazily
+        self._load_members()
+        generate_module(self, path)
+
+
+    #- - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - #
+    def _dump(self):
+        # Object hooks are stored by their names, and the shared nodes of the
+        # hierarchy are stored as lists of the names of their members
+        records = {}
+        for record in self._dispatch.values():
+            records[record[0]] = \
+                record[:4] + (record[4].__name__,) + record[5:7] + record[8:]
+        return {'flags'   : {f: p.name for f, p in self._flags.items()},
+                'nodes'   : {n: tuple(m) for n, m in self._nodes.items()},
+                'roots'   : tuple(self._hierarchy),
+                'index'   : self._prefix_index,
+                'records' : records}
+
+
+    #- - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - #
+    def _load(self, data):
+        patterns = self._patterns
+        # Rebuild the shared nodes of the hierarchy
+        self._nodes = nodes = {name: {} for name in data['nodes']}
+        for name, members in data['nodes'].items():
+            node = nodes[name]
+            for member in members:
+                node[member] = nodes[member]
+        self._hierarchy = {name: nodes[name] for name in data['roots']}
+        # Rebuild records and dispatch table
+        records = {}
+        for name, record in data['records'].items():
+            records[name] = (record[:4] + (getattr(Pattern, record[4]),) +
+                             record[5:7] + (nodes[name],) + record[7:])
+        self._flags        = {}
+        self._dispatch     = {}
+        for flag, name in data['flags'].items():
+            self._flags[flag]    = patterns[name]
+            self._dispatch[flag] = records[name]
+        self._prefix_index = data['index']
+        self._roots        = self._hierarchy
+
+
+    #- - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - #
+    def _parse_tables(self, arguments):
+        """
+        Table-driven implementation of _parse_iter, which does not use
+        exceptions for control flow. Each flag will be translated to a tuple:
+
+            ('<long_flag>', <value(s)>, [<member(s)>])
+
+        Errors:
+            The same as the errors of _parse_iter
+        """
+        dispatch     = self._dispatch
+        split        = self._split
+        # If there are lazy members or programs, which are not loaded yet
+        lazy         = bool(self._lazy_flags)
+        arguments    = iter(arguments)
+        pushed_back  = []
+        unique_flags = set()
+        # Stack of open patterns, each frame is a tuple of:
+        # (<name>, <object_hook>, [<member(s)>], <member names>,
+        #  <primal flags>, <ONE members or None>, <double_dash>)
+        stack        = []
+        context_path = []
+        # State of the top-level context
+        children     = self._roots
+        primals      = set()
+        ones         = None
+        values       = None
+        members      = None
+        double_dash  = ''
+        need_members = None
+        argument     = None
+
+        while True:
+            # Get next argument (pushed back arguments come first)
+            if pushed_back:
+                argument = pushed_back.pop()
+            else:
+                argument = next(arguments, NotImplemented)
+                # If all arguments processed
+                if argument is NotImplemented:
+                    break
+
+            # Get record associated with flag (argument)
+            record = dispatch.get(argument)
+            # If flag is a lazy member, which has just been loaded
+            if (record is None and
+                lazy and
+                self._load_lazy(argument)):
+                    record = dispatch.get(argument)
+            # If argument is not a flag
+            if record is None:
+                separated = split(argument)
+                # If flag and value separated, push them back
+                # (in reversed order) and start cycle again
+                if separated:
+                    flag, value = separated
+                    pushed_back.append(value)
+                    pushed_back.append(flag)
+                    continue
+                # If there are no open patterns waiting for values
+                if values is None:
+                    # If argument is the path of a program (e.g. argv[0])
+                    program = self._program(argument)
+                    if program is not None:
+                        pushed_back.append(program)
+                        continue
+                    raise Scheme.InvalidArgument(argument)
+                # If current argument indicates the end of the
+                # "traditional" arguments list
+                if (double_dash and
+                    argument == double_dash):
+                        # Process all arguments left
+                        while pushed_back:
+                            values.add_value(pushed_back.pop())
+                        for argument in arguments:
+                            values.add_value(argument)
+                        break
+                values.add_value(argument)
+                continue
+
+            (name, flag_type, member_one, member_required, object_hook,
+             value_necessity, pattern_double_dash, pattern_children,
+             pattern_members) = record
+
+            # If pattern is UNIQUE and already used
+            if flag_type == Pattern.UNIQUE:
+                if name in unique_flags:
+                    raise Scheme.DoubleUniqueArgument(argument)
+                unique_flags.add(name)
+
+            # Close patterns until the context of the flag is found
+            while name not in children:
+                # If current context requires a member
+                if need_members:
+                    raise Scheme.MissingMember(argument, need_members[0],
+                                               list(need_members[1]))
+                # If reached the top-level and the context still did not match
+                if len(stack) < 2:
+                    raise Scheme.ArgumentOutOfContext(context_path, argument)
+                # Close current pattern and jump one level up
+                closed_name, closed_values, closed_members, *_ = stack.pop()
+                (_, values, members, children,
+                 primals, ones, double_dash) = stack[-1]
+                members.append((closed_name,
+                                closed_values.close(name, argument),
+                                closed_members))
+
+            # Update context path
+            del context_path[len(stack):]
+            context_path.append(argument)
+
+            # If pattern is PRIMAL and already used in the current context
+            if flag_type == Pattern.PRIMAL:
+                if name in primals:
+                    raise Scheme.DoublePrimalArgument(context_path[-2], argument)
+                primals.add(name)
+
+            # If this pattern must be followed by one of its members
+            need_members = \
+                (argument, pattern_members) if member_required else None
+
+            # If current context limits the number of use of its members
+            if ones is not None:
+                ones[name] = argument
+                if len(ones) > 1:
+                    ones.pop(name)
+                    raise Scheme.TooManyMembersUsed(context_path[-2],
+                                                    ones.popitem()[1],
+                                                    argument)
+
+            # Open a new pattern
+            values      = object_hook(name, argument, value_necessity)
+            members     = []
+            children    = pattern_children
+            primals     = set()
+            ones        = {} if member_one else None
+            double_dash = pattern_double_dash
+            stack.append((name, values, members, children,
+                          primals, ones, double_dash))
+
+        # If there were no arguments at all
+        if not stack:
+            return []
+
+        # If current context requires a member
+        if need_members:
+            raise Scheme.MissingMember(Pattern.EOL(), need_members[0],
+                                       list(need_members[1]))
+
+        # Close all patterns left
+        while len(stack) > 1:
+            closed_name, closed_values, closed_members, *_ = stack.pop()
+            _, values, members, *_ = stack[-1]
+            members.append((closed_name,
+                            closed_values.close(NotImplemented, argument),
+                            closed_members))
+
+        # Return translated arguments
+        return [(stack[0][0], values.close(NotImplemented, argument), members)]
+
+
+    #- - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - #
+    def _parser(self, memoize=True):
+        # Use the table-driven parser if scheme has been compiled
+        if self._dispatch is None:
+            parse = self._parse_iter
+        else:
+            parse = self._parse_tables
+        # If results should be converted to compact Nodes
+        if self._compact:
+            # Import argon modules (only when compact results are used)
+            from argon.result import compact
+            parse = lambda arguments, parse=parse: compact(parse(arguments))
+        # If results are memoized, return the frozen result of the arguments
+        if memoize and self._memo is not None:
+            memo  = self._memo
+            parse = lambda arguments, parse=parse: memo(parse, arguments)
+        return parse
+
+
     #- - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - #
     def parse_iter(self, arguments,
                          debug        = False,
                          catch_errors = False):
+        parse = self._parser()
         if debug:
+            # Arguments can be an iterator, which is consumed by printing
+            arguments = tuple(arguments)
             new_line = '\n' + ' '*4
             print('\n==> Raw command:',
                   ' '.join(arguments), sep=new_line)
@@ -393,7 +1220,7 @@ class Scheme:
             #                   ^^^^^^ ~~~~~~
             #       UnfinishedPattern: SINGLE_VALUE, --this, --that
             try:
-                return self._parse_iter(arguments)
+                return parse(arguments)
 
             except Pattern.FinishedPattern as e:
                 type, flag, value = e.args
@@ -460,7 +1287,37 @@ class Scheme:
 
         # If no error catching
         else:
-            return self._parse_iter(arguments)
+            return parse(arguments)
+
+
+    #- - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - #
+    def query(self, arguments):
+        """
+        Parse arguments, and returns an argon.result.Query of the translated
+        arguments, which finds the translated patterns by their long flags
+        (e.g. '--output'), and by their context paths (e.g. ('app', '--build',
+        '--output')) in constant time
+
+        Errors:
+            The same as the errors of parse_iter
+        """
+        # Import argon modules (only when queries are used)
+        from argon.result import Query
+        return Query(self.parse_iter(arguments),
+                     {name: pattern.long_flag
+                      for name, pattern in self._patterns.items()})
+
+
+    #- - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - #
+    def memo_info(self):
+        """
+        Returns the statistics of the memoized results, or None if results
+        are not memoized:
+
+            MemoInfo(hits, misses, evictions, size, max_size)
+        """
+        if self._memo is not None:
+            return self._memo.info()
 
 
     #- - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - #
@@ -474,10 +1331,303 @@ class Scheme:
     def parse_line(self, arguments,
                          debug         = False,
                          catch_errors  = False,
-                         split_pattern = compile(r'(?<!\\)\s+')):
+                         split_pattern = r'(?<!\\)\s+',
+                         posix         = False,
+                         comments      = False):
+        """
+        Parse the arguments of a line, which is split by split_pattern, or if
+        posix is True, it is split lazily the same way as shlex.split splits
+        it: quotes and escapes are processed, and if comments is True, the
+        comments are ignored
+        """
+        if posix:
+            # Import argon modules (only when lines are parsed)
+            from argon.sources import split_line
+            return self.parse_iter(split_line(arguments, comments),
+                                   debug, catch_errors)
+        # Import python modules (only when lines are parsed)
+        from re import split
         return self.parse_iter(split(split_pattern, arguments), debug, catch_errors)
 
 
+    #- - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - #
+    def parse_stream(self, stream       = None,
+                           debug        = False,
+                           catch_errors = False,
+                           separator    = '\0'):
+        """
+        Parse the separated arguments read lazily from stream, which is
+        sys.stdin by default (for example the output of `find -print0`)
+        """
+        # Import argon modules (only when streams are parsed)
+        from argon.sources import stream_arguments
+        if stream is None:
+            # Import python modules (only when stdin is parsed)
+            from sys import stdin as stream
+        return self.parse_iter(stream_arguments(stream, separator),
+                               debug, catch_errors)
+
+
+    #- - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - #
+    def parse_response_files(self, arguments,
+                                   debug        = False,
+                                   catch_errors = False,
+                                   prefix       = '@',
+                                   separator    = '\n'):
+        """
+        Parse arguments, in which each argument starting with prefix is
+        replaced by the arguments of the referenced response file, which is
+        memory mapped and read lazily (for example '@objects.rsp')
+        """
+        # Import argon modules (only when response files are used)
+        from argon.sources import response_files
+        return self.parse_iter(response_files(arguments, prefix, separator),
+                               debug, catch_errors)
+
+
+    #- - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - #
+    def parse_many(self, arguments_list,
+                         workers    = None,
+                         chunk_size = 64):
+        """
+        Parse every sequence of arguments of arguments_list, and yield the
+        results in the same order, the same way as parse_iter returns them
+        (compact or memoized results included). Without workers, this is not
+        faster than a loop over parse_iter, as every sequence of arguments has
+        to be parsed from scratch anyway. If workers is specified, the
+        arguments are parsed by a pool of that many processes, and the scheme
+        is sent to each process only once, when the process is started.
+        (Compile the scheme first, to use the faster, table-driven parser.)
+
+        Errors:
+            The same as the errors of parse_iter, raised when the result of
+            the invalid arguments would be yielded
+        """
+        # If arguments should be parsed in this process
+        if workers is None:
+            parse = self._parser()
+            for arguments in arguments_list:
+                yield parse(arguments)
+        # If arguments should be parsed by a pool of processes
+        else:
+            # Import python modules (only when a pool is used)
+            from multiprocessing import Pool
+            with Pool(workers, _initialize_worker, (self,)) as pool:
+                # If results are memoized, the results of the processes are
+                # stored (or the already stored results are used) by this one
+                if self._memo is not None:
+                    # Import python modules (only when results are memoized)
+                    from itertools import tee
+                    memo = self._memo
+                    sent, parsed = tee(map(tuple, arguments_list))
+                    results = pool.imap(_parse_in_worker, parsed, chunk_size)
+                    for arguments, result in zip(sent, results):
+                        yield memo(lambda _, result=result: result, arguments)
+                else:
+                    yield from pool.imap(_parse_in_worker, arguments_list,
+                                         chunk_size)
+
+
+    #- - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - #
+    def __getstate__(self):
+        # Memoized results and locks are not sent to other processes
+        state = self.__dict__.copy()
+        state['_memo'] = None
+        state['_lock'] = None
+        return state
+
+
+    #- - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - #
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        # Import python modules (only when members are loaded lazily)
+        if self._lazy:
+            from threading import Lock
+            self._lock = Lock()
+
+
+    #- - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - #
+    def iter_events(self, arguments):
+        """
+        Parse arguments lazily with the compiled parser (the scheme is compiled
+        if it has not been compiled yet), and yield each event as soon as it is
+        known, without building the translated arguments. Events are tuples:
+
+            (Scheme.OPEN,  <long_flag>, <flag>)
+            (Scheme.VALUE, <long_flag>, <value> or (<key>, <value>))
+            (Scheme.CLOSE, <long_flag>, <flag>)
+            (Scheme.ERROR, None,        <exception>)
+
+        The same rules are enforced as by parse_iter, but an error is yielded
+        as the last event instead of being raised. Values of UNIQUE_ARRAY
+        patterns are yielded only at their first appearance, and values of
+        NAMED_VALUES patterns are yielded as key-value pairs. Apart from the
+        values of UNIQUE_ARRAY patterns, the memory used does not depend on
+        the number of arguments, so values after double_dash can be streamed.
+        """
+        if self._dispatch is None:
+            self.compile()
+        try:
+            yield from self._iter_events(arguments)
+        except (Pattern.PatternException, Scheme.SchemeException) as error:
+            yield Scheme.ERROR, None, error
+
+
+    #- - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - #
+    def _iter_events(self, arguments):
+        OPEN, VALUE, CLOSE = Scheme.OPEN, Scheme.VALUE, Scheme.CLOSE
+        StreamedValues = Scheme._StreamedValues
+        dispatch     = self._dispatch
+        split        = self._split
+        # If there are lazy members or programs, which are not loaded yet
+        lazy         = bool(self._lazy_flags)
+        arguments    = iter(arguments)
+        pushed_back  = []
+        unique_flags = set()
+        # Stack of open patterns, each frame is a tuple of:
+        # (<name>, <flag>, <streamed values>, <member names>,
+        #  <primal flags>, <ONE members or None>, <double_dash>)
+        stack        = []
+        context_path = []
+        # State of the top-level context
+        children     = self._roots
+        primals      = set()
+        ones         = None
+        values       = None
+        double_dash  = ''
+        need_members = None
+        argument     = None
+
+        while True:
+            # Get next argument (pushed back arguments come first)
+            if pushed_back:
+                argument = pushed_back.pop()
+            else:
+                argument = next(arguments, NotImplemented)
+                # If all arguments processed
+                if argument is NotImplemented:
+                    break
+
+            # Get record associated with flag (argument)
+            record = dispatch.get(argument)
+            # If flag is a lazy member, which has just been loaded
+            if (record is None and
+                lazy and
+                self._load_lazy(argument)):
+                    record = dispatch.get(argument)
+            # If argument is not a flag
+            if record is None:
+                separated = split(argument)
+                # If flag and value separated, push them back
+                # (in reversed order) and start cycle again
+                if separated:
+                    flag, value = separated
+                    pushed_back.append(value)
+                    pushed_back.append(flag)
+                    continue
+                # If there are no open patterns waiting for values
+                if values is None:
+                    # If argument is the path of a program (e.g. argv[0])
+                    program = self._program(argument)
+                    if program is not None:
+                        pushed_back.append(program)
+                        continue
+                    raise Scheme.InvalidArgument(argument)
+                name = stack[-1][0]
+                # If current argument indicates the end of the
+                # "traditional" arguments list
+                if (double_dash and
+                    argument == double_dash):
+                        # Stream all arguments left
+                        while pushed_back:
+                            value = values.add_value(pushed_back.pop())
+                            if value is not NotImplemented:
+                                yield VALUE, name, value
+                        for argument in arguments:
+                            value = values.add_value(argument)
+                            if value is not NotImplemented:
+                                yield VALUE, name, value
+                        break
+                value = values.add_value(argument)
+                if value is not NotImplemented:
+                    yield VALUE, name, value
+                continue
+
+            (name, flag_type, member_one, member_required, object_hook,
+             value_necessity, pattern_double_dash, pattern_children,
+             pattern_members) = record
+
+            # If pattern is UNIQUE and already used
+            if flag_type == Pattern.UNIQUE:
+                if name in unique_flags:
+                    raise Scheme.DoubleUniqueArgument(argument)
+                unique_flags.add(name)
+
+            # Close patterns until the context of the flag is found
+            while name not in children:
+                # If current context requires a member
+                if need_members:
+                    raise Scheme.MissingMember(argument, need_members[0],
+                                               list(need_members[1]))
+                # If reached the top-level and the context still did not match
+                if len(stack) < 2:
+                    raise Scheme.ArgumentOutOfContext(context_path, argument)
+                # Close current pattern and jump one level up
+                closed_name, closed_flag, closed_values, *_ = stack.pop()
+                (_, _, values, children,
+                 primals, ones, double_dash) = stack[-1]
+                closed_values.close(name, argument)
+                yield CLOSE, closed_name, closed_flag
+
+            # Update context path
+            del context_path[len(stack):]
+            context_path.append(argument)
+
+            # If pattern is PRIMAL and already used in the current context
+            if flag_type == Pattern.PRIMAL:
+                if name in primals:
+                    raise Scheme.DoublePrimalArgument(context_path[-2], argument)
+                primals.add(name)
+
+            # If this pattern must be followed by one of its members
+            need_members = \
+                (argument, pattern_members) if member_required else None
+
+            # If current context limits the number of use of its members
+            if ones is not None:
+                ones[name] = argument
+                if len(ones) > 1:
+                    ones.pop(name)
+                    raise Scheme.TooManyMembersUsed(context_path[-2],
+                                                    ones.popitem()[1],
+                                                    argument)
+
+            # Open a new pattern
+            values      = StreamedValues(object_hook, argument, value_necessity)
+            children    = pattern_children
+            primals     = set()
+            ones        = {} if member_one else None
+            double_dash = pattern_double_dash
+            stack.append((name, argument, values, children,
+                          primals, ones, double_dash))
+            yield OPEN, name, argument
+
+        # If there were no arguments at all
+        if not stack:
+            return
+
+        # If current context requires a member
+        if need_members:
+            raise Scheme.MissingMember(Pattern.EOL(), need_members[0],
+                                       list(need_members[1]))
+
+        # Close all patterns left
+        while stack:
+            closed_name, closed_flag, closed_values, *_ = stack.pop()
+            closed_values.close(NotImplemented, argument)
+            yield CLOSE, closed_name, closed_flag
+
+
     #- - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - #
     @staticmethod
     def branch_traverse(patterns):
@@ -486,24 +1636,66 @@ class Scheme:
 
             (<long_flag>, <value>)
         """
-        for flag, value, members in patterns:
-            yield flag, value
-            yield from Scheme.branch_traverse(members)
+        # Stack of the iterators of the members of the current branch
+        stack = [iter(patterns)]
+        while stack:
+            for flag, value, members in stack[-1]:
+                yield flag, value
+                # If pattern has members, continue with them
+                if members:
+                    stack.append(iter(members))
+                    break
+            else:
+                stack.pop()
 
 
     #- - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - #
     @staticmethod
-    def branch_full_traverse(patterns, path=[]):
+    def branch_full_traverse(patterns, path=None, immutable=False):
         """
         Returns:
 
             ([<group>..., <long_flag>], <value>)
+
+        The yielded path is the same list for every pattern, updated in place
+        (and owned by the call, unless path is given), or if immutable is True,
+        it is a new tuple for every pattern:
+
+            ((<group>..., <long_flag>), <value>)
         """
-        for flag, value, members in patterns:
-            path.append(flag)
-            yield path, value
-            yield from Scheme.branch_full_traverse(members, path)
-            path.pop()
+        # If paths are tuples, each iterator is stored with the path of its
+        # patterns' context, so the path of each pattern is created only once
+        if immutable:
+            stack = [(tuple(path or ()), iter(patterns))]
+            while stack:
+                context, members_iter = stack[-1]
+                for flag, value, members in members_iter:
+                    flag_path = context + (flag,)
+                    yield flag_path, value
+                    if members:
+                        stack.append((flag_path, iter(members)))
+                        break
+                else:
+                    stack.pop()
+            return
+
+        # If path is a list, it is updated in place: it has an item for
+        # each iterator on the stack, and the last one is replaced by the
+        # long flag of the current pattern
+        path  = [] if path is None else path
+        stack = [iter(patterns)]
+        path.append(None)
+        while stack:
+            for flag, value, members in stack[-1]:
+                path[-1] = flag
+                yield path, value
+                if members:
+                    stack.append(iter(members))
+                    path.append(None)
+                    break
+            else:
+                stack.pop()
+                path.pop()
 
 
     #- - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - #
@@ -523,26 +1715,157 @@ class Scheme:
                 patterns.append((flag, fmembers))
 
 
+    #- - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - #
+    def _render(self, blocks, width, tab_size, color):
+        # Import python modules (only when help is rendered)
+        from io import StringIO
+
+        buffer = StringIO()
+        Section(*blocks).write(indent   = 0,
+                               stream   = buffer,
+                               width    = width,
+                               spaces   = abs(int(tab_size))*' ',
+                               no_color = not color,
+                               color    = color,
+                               owner    = None,
+                               patterns = self._patterns)
+        return buffer.getvalue()
+
+
     #- - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - #
     def write_help(self, *blocks,
                          file     = stdout,
                          width    = None,
                          tab_size = 4,
                          no_color = False):
+        """
+        Write the help text of blocks to file. The last HELP_CACHE_SIZE
+        rendered texts are cached by the contents of the blocks, the width,
+        the tab_size and whether colors are used, so the same help text is
+        rendered only once (even if its blocks are created again for every
+        call), and it is written to file at once.
+        """
+        # Import python modules (only when help is rendered)
+        from shutil import get_terminal_size
+
+        width = width or get_terminal_size().columns
+        color = not no_color and colors_available(file)
+        key   = Section(*blocks)._key(), width, tab_size, color
+        # Texts are stored in the order of their use (the least recently used
+        # one is the first), other threads can use the same texts meanwhile
+        cache = self._help
+        try:
+            text = cache.pop(key)
+        except KeyError:
+            text = self._render(blocks, width, tab_size, color)
+        cache[key] = text
+        if len(cache) > HELP_CACHE_SIZE:
+            try:
+                del cache[next(iter(cache))]
+            except (KeyError, RuntimeError, StopIteration):
+                pass
+
         # Write all blocks to file
-        Section(*blocks).write(indent   = 0,
-                               stream   = file,
-                               width    = width or get_terminal_size().columns,
-                               spaces   = abs(int(tab_size))*' ',
-                               no_color = no_color,
-                               owner    = None,
-                               patterns = self._patterns)
+        file.write(text)
+
+
+    #- - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - #
+    def context_blocks(self, path):
+        """
+        Returns the blocks of the help text of the context at path, which is
+        a sequence of names of patterns, each one is a member of the previous
+        one (e.g. ('app', 'build', 'target')): the description of the context,
+        the descriptions of its members and the descriptions of the options
+        (members without members) of the contexts above it. Members are in
+        the order of the declaration of the patterns.
+        """
+        # Import argon modules (only when help is rendered)
+        from argon.text import Header
+
+        path = tuple(path)
+        try:
+            return self._contexts[path]
+        except KeyError:
+            pass
+
+        # Load the lazy members of the contexts (from the top-level one)
+        for name in path:
+            self._load_members(name)
+
+        # Check if each pattern is a member of the previous one
+        nodes = self._nodes
+        for context, name in zip((None,) + path, path):
+            if (name not in nodes or
+                (context is not None and name not in nodes[context])):
+                    raise ValueError('Invalid context path: {!r}'.format(path))
+
+        # Order of the declaration of the patterns
+        if self._order is None:
+            self._order = {name: i for i, name in enumerate(self._patterns)}
+        order   = self._order.get
+        members = sorted(nodes[path[-1]], key=order)
+        blocks  = [path[-1]]
+        if members:
+            blocks.append(Section(*members, indent=1))
+        # Options of the contexts above, from the closest one
+        inherited = []
+        ignored   = set(members)
+        ignored.update(path)
+        for context in reversed(path[:-1]):
+            for name in sorted(nodes[context], key=order):
+                if not (name in ignored or nodes[name]):
+                    inherited.append(name)
+                    ignored.add(name)
+        if inherited:
+            blocks.append(Section(Header('INHERITED OPTIONS'),
+                                  Section(*inherited, indent=1)))
+        blocks = self._contexts[path] = Section(*blocks),
+        return blocks
+
+
+    #- - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - #
+    def write_context_help(self, path,
+                                 file     = stdout,
+                                 width    = None,
+                                 tab_size = 4,
+                                 no_color = False):
+        """
+        Write the help text of the context at path (see context_blocks)
+        """
+        self.write_help(*self.context_blocks(path), file     = file,
+                                                    width    = width,
+                                                    tab_size = tab_size,
+                                                    no_color = no_color)
 
 
     #- - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - #
     @staticmethod
     def print_hierarchy(hierarchy, indent=0, prefix='... '):
-        prefix *= indent
-        for context, members in sorted(hierarchy.items()):
-            yield prefix + context + (':' if members else '')
-            yield from Scheme.print_hierarchy(members, indent + 1)
+        # Stack of the iterators of the currently visited nodes
+        branches = [iter(sorted(hierarchy.items()))]
+        while branches:
+            for context, members in branches[-1]:
+                yield (prefix*(indent + len(branches) - 1) +
+                       context + (':' if members else ''))
+                # If context has members, visit them first
+                if members:
+                    branches.append(iter(sorted(members.items())))
+                    break
+            # If all members of the current node have been visited
+            else:
+                branches.pop()
+
+
+
+#------------------------------------------------------------------------------#
+# Parser used by the processes of Scheme.parse_many
+_worker_parse = None
+
+#------------------------------------------------------------------------------#
+def _initialize_worker(scheme):
+    global _worker_parse
+    _worker_parse = scheme._parser(memoize=False)
+
+#------------------------------------------------------------------------------#
+def _parse_in_worker(arguments):
+    return _worker_parse(arguments)
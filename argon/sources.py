@@ -0,0 +1,171 @@
+## INFO ##
+## INFO ##
+
+"""
+Lazy sources of arguments. Each function returns an iterator of arguments,
+which can be passed to Scheme.parse_iter as it is, and the arguments are only
+read when the parser asks for them, so the sources are never loaded into the
+memory at once.
+"""
+
+# Import python modules
+from re        import compile, sub, DOTALL
+from os        import fsdecode
+from mmap      import mmap, ACCESS_READ
+from itertools import chain
+
+# Size of the chunks read from streams
+CHUNK_SIZE = 1 << 16
+
+# Pieces of a shell-like line (in POSIX mode of shlex): whitespaces, unquoted
+# characters, single and double quoted strings, escaped characters, comments
+# and the start of an unfinished quote or escape which cannot be matched
+_PIECE = (r'(?P<space>[ \t\r\n]+)'
+          r'|(?P<word>[^ \t\r\n\'"\\{}]+)'
+          r'|\'(?P<single>[^\']*)\''
+          r'|"(?P<double>(?:[^"\\]|\\.)*)"'
+          r'|\\(?P<escaped>.)'
+          r'{}'
+          r'|(?P<unfinished>.)')
+_PIECES = {False: compile(_PIECE.format('', ''), DOTALL),
+           True : compile(_PIECE.format('#', r'|(?P<comment>#[^\n]*)'), DOTALL)}
+
+
+
+#------------------------------------------------------------------------------#
+def mapped_file(path, separator='\n'):
+    """
+    Yield the separated arguments of the file at path. The file is memory
+    mapped, therefore only the pages of the currently parsed arguments are
+    loaded. Arguments are decoded with the file system encoding, a separator
+    at the end of the file does not start a new argument.
+    """
+    separator = separator.encode()
+    length    = len(separator)
+    with open(path, 'rb') as file:
+        # Empty files cannot be mapped
+        try:
+            mapped = mmap(file.fileno(), 0, access=ACCESS_READ)
+        except ValueError:
+            return
+        with mapped:
+            size  = len(mapped)
+            start = 0
+            while start < size:
+                end = mapped.find(separator, start)
+                if end < 0:
+                    end = size
+                yield fsdecode(mapped[start:end])
+                start = end + length
+
+
+
+#------------------------------------------------------------------------------#
+def stream_arguments(stream, separator='\0', chunk_size=CHUNK_SIZE):
+    """
+    Yield the separated arguments of stream (for example the output of
+    `find -print0`), which is read in chunks of chunk_size. If stream is a
+    text stream, its underlying binary buffer is read, or if it has none (for
+    example io.StringIO), its text is split. A separator at the end of the
+    stream does not start a new argument.
+    """
+    stream = getattr(stream, 'buffer', stream)
+    chunk  = stream.read(chunk_size)
+    # If stream is a text stream without a binary buffer
+    if isinstance(chunk, str):
+        rest   = ''
+        decode = str
+    else:
+        separator = separator.encode()
+        rest      = b''
+        decode    = fsdecode
+    while chunk:
+        *arguments, rest = (rest + chunk).split(separator)
+        for argument in arguments:
+            yield decode(argument)
+        chunk = stream.read(chunk_size)
+    if rest:
+        yield decode(rest)
+
+
+
+#------------------------------------------------------------------------------#
+def response_files(arguments, prefix='@', separator='\n'):
+    """
+    Yield arguments, but replace each argument starting with prefix by the
+    arguments of the referenced response file (for example '@objects.rsp'),
+    which are read by mapped_file. Response files can reference other response
+    files, but not the ones they are referenced by. If a response file cannot
+    be opened, the argument is yielded unchanged.
+    """
+    # Stack of the iterators of the opened response files,
+    # and the paths of the response files which are opened
+    stack = [iter(arguments)]
+    paths = []
+    while stack:
+        for argument in stack[-1]:
+            if argument.startswith(prefix):
+                path = argument[len(prefix):]
+                if path not in paths:
+                    arguments = mapped_file(path, separator)
+                    # Open the response file by reading its first argument
+                    try:
+                        first = next(arguments, None)
+                    except OSError:
+                        pass
+                    else:
+                        if first is not None:
+                            stack.append(chain((first,), arguments))
+                            paths.append(path)
+                            break
+                        continue
+            yield argument
+        else:
+            stack.pop()
+            if paths:
+                paths.pop()
+
+
+
+#------------------------------------------------------------------------------#
+def split_line(line, comments=False):
+    """
+    Yield the arguments of line, which is split the same way as shlex.split
+    splits it: POSIX quoting and escaping rules are applied, and if comments
+    is True, everything from a '#' to the end of the line is ignored. The line
+    is processed in a single pass.
+
+    Errors:
+        ValueError, if a quote is not closed, or if the last character is an
+        escaping backslash
+    """
+    pieces = []
+    quoted = False
+    for match in _PIECES[comments].finditer(line):
+        kind  = match.lastgroup
+        piece = match.group(kind)
+        if kind in ('word', 'escaped'):
+            pieces.append(piece)
+        elif kind == 'single':
+            pieces.append(piece)
+            quoted = True
+        elif kind == 'double':
+            pieces.append(sub(r'\\(["\\])', r'\1', piece)
+                          if '\\' in piece else piece)
+            quoted = True
+        elif kind == 'unfinished':
+            # Inside an unfinished double quoted string, an odd number of
+            # backslashes at the end of the line is an unfinished escape
+            rest = line[match.start():]
+            if (piece == '\\' or
+                (piece == '"' and
+                 (len(rest) - len(rest.rstrip('\\')))%2)):
+                    raise ValueError('No escaped character')
+            raise ValueError('No closing quotation')
+        # If the argument is finished (by whitespaces or a comment)
+        elif pieces or quoted:
+            yield ''.join(pieces)
+            pieces = []
+            quoted = False
+    if pieces or quoted:
+        yield ''.join(pieces)
@@ -2,11 +2,103 @@
 ## INFO ##
 
 # Import python modules
-from textwrap import fill
-from os       import isatty
+from os import isatty
 
-# Import argon modules
-import argon
+
+
+#------------------------------------------------------------------------------#
+def colors_available(stream):
+    """
+    Returns True if stream is a terminal, which can display colors
+    """
+    try:
+        return isatty(stream.fileno())
+    # If stream has no file descriptor (e.g. io.StringIO raises
+    # io.UnsupportedOperation, which is both OSError and ValueError)
+    except (AttributeError, OSError, ValueError):
+        return False
+
+
+
+#------------------------------------------------------------------------------#
+class Wrapped:
+    """
+    Paragraph which is split into chunks (words and whitespaces) only once, the
+    same way as textwrap splits it, and which can be wrapped to any width by a
+    greedy pass over the lengths of the chunks. The result is the same as the
+    result of textwrap.fill, and it is cached by width: if the paragraph fits
+    into a line, every wider width gives the same result.
+    """
+
+    #- - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - #
+    def __init__(self, text):
+        # Import python modules (only when help is rendered)
+        from textwrap import TextWrapper
+
+        self._text    = text
+
+        # Split text the same way as TextWrapper does with its default options:
+        # tabs are expanded, all whitespaces are replaced by spaces, and text
+        # is split into words (and hyphenated parts of words) and whitespaces
+        wrapper = TextWrapper()
+        text    = text.expandtabs(wrapper.tabsize)
+        text    = text.translate(wrapper.unicode_whitespace_trans)
+        chunks  = [chunk for chunk in wrapper.wordsep_re.split(text) if chunk]
+        self._chunks  = chunks
+        self._lengths = lengths = [len(chunk) for chunk in chunks]
+        self._spaces  = [not chunk.strip() for chunk in chunks]
+        self._longest = max(lengths, default=0)
+        self._length  = sum(lengths)
+        self._lines   = {}
+
+
+    #- - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - #
+    def fill(self, width, indent):
+        # Width of the text, without the indentation
+        space = width - len(indent)
+        key   = min(space, self._length)
+        try:
+            lines = self._lines[key]
+        except KeyError:
+            # If words have to be broken (or width is invalid)
+            # let textwrap handle it, and cache its result
+            if width <= 0 or self._longest > space:
+                # Import python modules (only when help is rendered)
+                from textwrap import wrap
+                lines = [line[len(indent):] for line in
+                            wrap(self._text, width, initial_indent    = indent,
+                                                    subsequent_indent = indent)]
+            else:
+                lines = self._wrap(space)
+            self._lines[key] = lines
+        return '\n'.join(indent + line for line in lines)
+
+
+    #- - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - #
+    def _wrap(self, width):
+        # Same as textwrap.TextWrapper._wrap_chunks, but every
+        # chunk fits into width, and they are not copied around
+        chunks  = self._chunks
+        lengths = self._lengths
+        spaces  = self._spaces
+        count   = len(chunks)
+        lines   = []
+        index   = 0
+        while index < count:
+            # Drop whitespace at the beginning of every line but the first
+            if lines and spaces[index]:
+                index += 1
+            start  = index
+            length = 0
+            while (index < count and
+                   length + lengths[index] <= width):
+                length += lengths[index]
+                index  += 1
+            # Drop whitespace at the end of line
+            end = index - 1 if index > start and spaces[index - 1] else index
+            if end > start:
+                lines.append(''.join(chunks[start:end]))
+        return lines
 
 
 
@@ -31,37 +123,59 @@ class Block:
     def __init__(self, *blocks,
                        indent=None,
                        ending=None):
-        self._blocks = blocks
+        self._blocks  = blocks
+        self._wrapped = {}
         self._indent = self.INDENT if indent is None else indent
         self._ending = self.ENDING if ending is None else ending
 
 
     #- - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - #
-    def write(self, indent,
-                    stream,
-                    width,
-                    spaces,
-                    owner    = None,
-                    patterns = {},
-                    no_color = False,
-                    strong   = False):
-        # Indent and wrap text
-        indent = (indent + self._indent)*spaces
-        text = []
-        for paragraph in self._blocks:
-            text.append(fill(paragraph, width, initial_indent    = indent,
-                                               subsequent_indent = indent))
+    def _key(self):
+        # Blocks with the same type, options, owner and contents have the same
+        # key (patterns and their references are not resolved), which can be
+        # used to cache the rendered texts of the blocks
+        return (self.__class__,
+                self._indent,
+                self._ending,
+                getattr(self, '_owner', None),
+                tuple(b._key() if isinstance(b, Block) else b
+                      for b in self._blocks))
+
+
+    #- - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - #
+    def write(self, *args, **kwargs):
+        self._write(self._blocks, *args, **kwargs)
+
+
+    #- - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - #
+    def _write(self, paragraphs,
+                     indent,
+                     stream,
+                     width,
+                     spaces,
+                     owner    = None,
+                     patterns = {},
+                     no_color = False,
+                     strong   = False,
+                     color    = None):
+        # Indent and wrap text (paragraphs are split into chunks only once)
+        indent  = (indent + self._indent)*spaces
+        wrapped = self._wrapped
+        text    = []
+        for paragraph in paragraphs:
+            try:
+                paragraph = wrapped[paragraph]
+            except KeyError:
+                paragraph = wrapped[paragraph] = Wrapped(paragraph)
+            text.append(paragraph.fill(width, indent))
         text = '\n'.join(text)
 
-        # Colorize text if instructed
-        # and colors are available
-        try:
-            if (not no_color and
-                strong and
-                isatty(stream.fileno())):
-                    text = '\033[1m{}\033[0m'.format(text)
-        except AttributeError:
-            pass
+        # Colorize text if instructed and colors are available (if it
+        # is not known yet whether they are available, check the stream)
+        if (not no_color and
+            strong and
+            (colors_available(stream) if color is None else color)):
+                text = '\033[1m{}\033[0m'.format(text)
 
         # Write content to stream
         print(text, file=stream, end=self._ending)
@@ -83,6 +197,10 @@ class Section(Block):
         # Increase indentation
         kwargs['indent'] += self._indent
 
+        # Import argon modules (only when a section is written, as
+        # argon.pattern imports this module)
+        from argon.pattern import Pattern
+
         for block in self._blocks:
             # If block is a string reference to a Pattern
             if isinstance(block, str):
@@ -93,7 +211,7 @@ class Section(Block):
                                      '{!r}'.format(block)) from None
 
             # If block is a Pattern object
-            elif isinstance(block, argon.pattern.Pattern):
+            elif isinstance(block, Pattern):
                 block = block.description
 
             # If block is something unexpected
@@ -141,11 +259,15 @@ class Flags(Block):
         super().__init__(*args, **kwargs)
 
 
+    #- - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - #
+    def _key(self):
+        return super()._key() + (self._new_line,)
+
+
     #- - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - #
     def write(self, *args, **kwargs):
         values = ' '.join(self._blocks)
         text   = []
-        blocks = self._blocks
 
         # Construct flags
         try:
@@ -155,14 +277,13 @@ class Flags(Block):
             raise ValueError('Flags should be used inside a Section, which '
                              'should be passed to a Pattern, before the '
                              'writing is happening') from None
-        # TODO: ** Clean this mess up **
-        #       Make it simple and beautiful
+        # The flags are written instead of the blocks (they are not stored,
+        # so the same Flags can be written by more than one thread at once)
         if self._new_line:
-            self._blocks = [f + ',' for f in text[:-1]]
-            self._blocks.append(text[-1])
+            paragraphs = [f + ',' for f in text[:-1]]
+            paragraphs.append(text[-1])
         else:
-            self._blocks = (', '.join(text),)
+            paragraphs = ', '.join(text),
 
         # Write content to stream
-        super().write(*args, strong=True, **kwargs)
-        self._blocks = blocks
+        self._write(paragraphs, *args, strong=True, **kwargs)
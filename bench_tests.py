@@ -0,0 +1,278 @@
+## INFO ##
+## INFO ##
+
+# Import python modules
+from time import perf_counter
+
+# Import argon modules
+from argon import *
+
+
+#------------------------------------------------------------------------------#
+# Timer helper
+def measure(function, *arguments, repeat=3):
+    best = float('inf')
+    for _ in range(repeat):
+        start = perf_counter()
+        function(*arguments)
+        best = min(best, perf_counter() - start)
+    return best
+
+
+#------------------------------------------------------------------------------#
+# Linearity checker: doubling the input should not quadruple the time
+def linear(name, function, sizes, tolerance=3.0):
+    print('\n' + '-'*80)
+    print(name)
+    previous = None
+    for size in sizes:
+        elapsed = measure(function, size, repeat=1)
+        print('    {:>9,} tokens: {:8.3f}s'.format(size, elapsed))
+        if previous is not None:
+            ratio = elapsed/previous[1]/(size/previous[0])
+            if ratio > tolerance:
+                print('[FAIL] grows {:.1f}x faster than linear'.format(ratio))
+                break
+        previous = size, elapsed
+    else:
+        print('[PASS]')
+
+
+#------------------------------------------------------------------------------#
+# Delimited flags: every `--define=KEY=VAL` is split and pushed back
+delimited = Scheme(Program('app',
+                           members=('define',)),
+
+                   Pattern('define',
+                           value_type=Pattern.COMMON_ARRAY,
+                           value_delimiter='='))
+
+def parse_delimited(size):
+    delimited.parse_iter(('app',) + ('--define=KEY=VAL',)*size)
+
+linear('Delimited flags (--define=KEY=VAL):',
+       parse_delimited, (125000, 250000, 500000, 1000000))
+
+
+#------------------------------------------------------------------------------#
+# Throughput comparison helper
+def compare(name, baseline, candidate, repeat=3):
+    print('\n' + '-'*80)
+    print(name)
+    before = measure(baseline, repeat=repeat)
+    after  = measure(candidate, repeat=repeat)
+    print('    baseline : {:8.3f}s'.format(before),
+          '    candidate: {:8.3f}s'.format(after),
+          '    speed-up : {:8.2f}x'.format(before/after), sep='\n')
+
+
+#------------------------------------------------------------------------------#
+# Original, exception-driven parser vs. compiled, table-driven parser
+routing = Scheme(Program('app',
+                         members=('alpha', 'beta', 'define', 'context')),
+
+                 Pattern('alpha',
+                         short_flags='a',
+                         value_type=Pattern.STATE_SWITCH),
+
+                 Pattern('beta'),
+
+                 Pattern('define',
+                         value_type=Pattern.COMMON_ARRAY,
+                         value_delimiter='='),
+
+                 Pattern('context',
+                         members=('alpha', 'beta'),
+                         value_type=Pattern.STATE_SWITCH)).compile()
+
+routing_command = ('app', '--alpha', '--beta', 'x', '--define=K=V', 'a', 'b',
+                          '--context', '-a', '--beta', 'y')
+
+def parse_many_times(parse, times=20000):
+    for _ in range(times):
+        parse(routing_command)
+
+compare('Original vs. compiled parser (20,000 commands):',
+        lambda: parse_many_times(routing._parse_iter),
+        lambda: parse_many_times(routing._parse_tables))
+
+
+#------------------------------------------------------------------------------#
+# Diamond-shaped scheme: each level has two patterns, and both of them are
+# members of both patterns of the level above, therefore a tree of copied
+# branches would have 2**depth nodes, while the shared hierarchy has 2*depth
+def diamond(depth):
+    patterns = [Program('app', members=('l0a', 'l0b'))]
+    for level in range(depth):
+        members = ('l{}a'.format(level + 1), 'l{}b'.format(level + 1))
+        for side in 'ab':
+            patterns.append(Pattern('l{}{}'.format(level, side),
+                                    value_type=Pattern.STATE_SWITCH,
+                                    members=members if level < depth - 1 else ()))
+    return Scheme(*patterns)
+
+print('\n' + '-'*80)
+print('Diamond-shaped scheme (depth of 32):')
+elapsed = measure(diamond, 32, repeat=1)
+print('    {:8.3f}s'.format(elapsed))
+print('[PASS]' if elapsed < 1 else '[FAIL]')
+
+
+#------------------------------------------------------------------------------#
+# Batch parsing vs. a plain loop over parse_args of the same scheme (without
+# workers parse_many is a loop as well, so no speed-up is expected from it)
+batch = Scheme(*routing._patterns.values())
+batch_commands = [routing_command]*20000
+
+compare('Loop over parse_args vs. parse_many (20,000 commands):',
+        lambda: [batch.parse_args(*command) for command in batch_commands],
+        lambda: list(batch.parse_many(batch_commands)))
+
+compare('Loop over parse_args vs. parse_many, compiled (20,000 commands):',
+        lambda: [routing.parse_args(*command) for command in batch_commands],
+        lambda: list(routing.parse_many(batch_commands)))
+
+compare('Loop over parse_args vs. parse_many with 2 workers, compiled '
+        '(20,000 commands):',
+        lambda: [routing.parse_args(*command) for command in batch_commands],
+        lambda: list(routing.parse_many(batch_commands, workers=2)),
+        repeat=1)
+
+
+#------------------------------------------------------------------------------#
+# Splitting lines: shlex.split vs. the single-pass POSIX tokenizer, and the
+# regular expression split of parse_line (which does not process quotes)
+from re            import split
+from shlex         import split as shlex_split
+from argon.sources import split_line
+
+lines = ['app --beta "quoted value" --define=K=V a\\ b \'c d\' --context -a']*20000
+
+compare('shlex.split vs. split_line (20,000 lines):',
+        lambda: [shlex_split(line) for line in lines],
+        lambda: [list(split_line(line)) for line in lines])
+
+compare('Regular expression split vs. split_line (20,000 lines):',
+        lambda: [split(r'(?<!\\)\s+', line) for line in lines],
+        lambda: [list(split_line(line)) for line in lines])
+
+
+#------------------------------------------------------------------------------#
+# Memory retained by the translated arguments: nested tuples and lists vs.
+# compact Nodes (a wide context with many STATE_SWITCH members)
+from tracemalloc import start, stop, take_snapshot
+
+wide = dict(members=['flag{}'.format(i) for i in range(1000)])
+wide_patterns = [Program('app', **wide)]
+wide_patterns.extend(Pattern('flag{}'.format(i),
+                             value_type=Pattern.STATE_SWITCH)
+                     for i in range(1000))
+wide_command = ['app'] + ['--flag{}'.format(i) for i in range(1000)]
+
+def retained(scheme, times=20):
+    start()
+    before  = take_snapshot()
+    results = [scheme.parse_iter(wide_command) for _ in range(times)]
+    after   = take_snapshot()
+    stop()
+    return sum(s.size_diff for s in after.compare_to(before, 'filename'))
+
+print('\n' + '-'*80)
+print('Memory per translated pattern (20 x 1,001 patterns):')
+plain_size   = retained(Scheme(*wide_patterns))/20/1001
+compact_size = retained(Scheme(*wide_patterns, compact=True))/20/1001
+print('    tuples and lists: {:6.1f} bytes'.format(plain_size),
+      '    compact Nodes   : {:6.1f} bytes'.format(compact_size), sep='\n')
+print('[PASS]' if compact_size < plain_size else '[FAIL]')
+
+
+#------------------------------------------------------------------------------#
+# Traversing 10,000 translated patterns: recursive generators (as the
+# traverse functions used to be) vs. the iterative traverse functions
+def recursive_full_traverse(patterns, path):
+    for flag, value, members in patterns:
+        path.append(flag)
+        yield path, value
+        yield from recursive_full_traverse(members, path)
+        path.pop()
+
+def balanced(width, depth):
+    return [('flag', None, balanced(width, depth - 1) if depth else [])
+            for _ in range(width)]
+
+def nested(length):
+    patterns = []
+    for _ in range(length):
+        patterns = [('flag', None, patterns)]
+    return patterns
+
+tree = balanced(10, 3)
+
+compare('Recursive vs. iterative branch_full_traverse (11,110 patterns):',
+        lambda: [None for _ in recursive_full_traverse(tree, [])],
+        lambda: [None for _ in Scheme.branch_full_traverse(tree)])
+
+compare('Recursive vs. iterative branch_full_traverse, tuple paths '
+        '(11,110 patterns):',
+        lambda: [tuple(path) for path, _ in recursive_full_traverse(tree, [])],
+        lambda: [path for path, _ in
+                    Scheme.branch_full_traverse(tree, immutable=True)])
+
+print('\n' + '-'*80)
+print('Chain of 10,000 nested patterns:')
+deep = nested(10000)
+try:
+    for traverse in (Scheme.branch_traverse,
+                     Scheme.branch_full_traverse,
+                     Scheme.breadth_first_traverse):
+        print('    {}: {:8.3f}s'.format(
+            traverse.__name__,
+            measure(lambda: [None for _ in traverse(deep)], repeat=1)))
+    print('[PASS]')
+except RecursionError:
+    print('[FAIL] recursion limit reached')
+
+
+#------------------------------------------------------------------------------#
+# Help text of 2,000 patterns: rendered every time vs. rendered once
+from io import StringIO
+
+helpful = Scheme(Program('app',
+                         members=['option{}'.format(i) for i in range(2000)]),
+                 *(Pattern('option{}'.format(i),
+                           description='Sets option number {}, which is '
+                                       'described by a long enough sentence '
+                                       'to be wrapped.'.format(i))
+                   for i in range(2000)))
+helpful_blocks = Section(*('option{}'.format(i) for i in range(2000)))
+
+def render(times=10):
+    for _ in range(times):
+        Section(helpful_blocks).write(indent=0, stream=StringIO(), width=80,
+                                      spaces='    ', no_color=True,
+                                      owner=None, patterns=helpful._patterns)
+
+compare('Rendered vs. cached help text of 2,000 patterns (10 times):',
+        render,
+        lambda: [helpful.write_help(helpful_blocks, file=StringIO(), width=80)
+                 for _ in range(10)],
+        repeat=1)
+
+
+#------------------------------------------------------------------------------#
+# Re-wrapping the help text of 500 patterns to every width from 40 to 240:
+# textwrap.fill on every paragraph vs. the chunks of the paragraphs split once
+from textwrap   import fill
+from argon.text import Wrapped
+
+paragraphs = ['Sets option number {}, which is described by a long enough '
+              'sentence to be wrapped.'.format(i) for i in range(500)]
+wrapped    = [Wrapped(paragraph) for paragraph in paragraphs]
+
+compare('textwrap.fill vs. Wrapped.fill (500 paragraphs, widths 40-240):',
+        lambda: [fill(paragraph, width, initial_indent='    ',
+                                        subsequent_indent='    ')
+                 for width in range(40, 241) for paragraph in paragraphs],
+        lambda: [paragraph.fill(width, '    ')
+                 for width in range(40, 241) for paragraph in wrapped],
+        repeat=1)
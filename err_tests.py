@@ -1,6 +1,11 @@
 ## INFO ##
 ## INFO ##
 
+# Import python modules
+from os.path        import join
+from tempfile       import mkdtemp
+from importlib.util import spec_from_file_location, module_from_spec
+
 from argon import *
 
 def cmd(scheme, line):
@@ -8,6 +13,86 @@ def cmd(scheme, line):
     processed = scheme.parse_line(line, True, True)
     if processed:
         print('==> Processed:\n    ', processed, sep='')
+    compare(scheme, line.split())
+
+#------------------------------------------------------------------------------#
+# Check if the compiled, table-driven parser gives the same result
+def compare(scheme, arguments):
+    results = []
+    for parse in (scheme._parse_iter,
+                  scheme.compile()._parse_tables):
+        try:
+            results.append(repr(parse(arguments)))
+        except Exception as error:
+            results.append(repr(error))
+    if results[0] != results[1]:
+        print('[FAIL] compiled parser:', *results, sep='\n    ')
+    # Check if the events of the streaming parser describe the same result
+    try:
+        expected = repr(plain(scheme._parse_iter(arguments)))
+    except Exception as error:
+        expected = repr(error)
+    streamed = repr(from_events(scheme, scheme.iter_events(arguments)))
+    if expected != streamed:
+        print('[FAIL] streamed events:', expected, streamed, sep='\n    ')
+    # Check if the generated standalone parser gives the same result
+    results = []
+    for parse in (scheme._parse_iter, generated(scheme).parse_iter):
+        try:
+            results.append(repr(plain(parse(arguments))))
+        except Exception as error:
+            results.append(described(error))
+    if results[0] != results[1]:
+        print('[FAIL] generated parser:', *results, sep='\n    ')
+
+# Generated modules of the schemes (the schemes are kept, so their ids
+# are not reused), and the directory of the generated modules
+modules   = {}
+directory = mkdtemp()
+
+def generated(scheme):
+    try:
+        return modules[id(scheme)][1]
+    except KeyError:
+        path = join(directory, 'parser{}.py'.format(len(modules)))
+        scheme.generate_module(path)
+        spec   = spec_from_file_location('parser{}'.format(len(modules)), path)
+        module = module_from_spec(spec)
+        spec.loader.exec_module(module)
+        modules[id(scheme)] = scheme, module
+        return module
+
+# Errors of both parsers are described by their names and arguments (the
+# classes of the object hooks are described by their names as well)
+def described(error):
+    return repr((error.__class__.__name__,
+                 tuple(a.__name__ if isinstance(a, type) else repr(a)
+                       for a in error.args)))
+
+def plain(patterns):
+    return [(name, value if isinstance(value, (bool, str, type(None)))
+                   else list(value.items()) if hasattr(value, 'items')
+                   else list(value), plain(members))
+            for name, value, members in patterns]
+
+def from_events(scheme, events):
+    stack = [(None, None, [])]
+    for event, name, data in events:
+        if event == Scheme.ERROR:
+            return data
+        elif event == Scheme.OPEN:
+            hook = scheme._patterns[name].object_hook
+            stack.append((name,
+                          [] if hook is not Pattern.STATE_SWITCH else True,
+                          []))
+        elif event == Scheme.VALUE:
+            stack[-1][1].append(data)
+        else:
+            name, values, members = stack.pop()
+            if scheme._patterns[name].object_hook is Pattern.SINGLE_VALUE:
+                values = values[0] if values else None
+            stack[-1][2].append((name, values, members))
+    return stack[0][2]
 
 #------------------------------------------------------------------------------#
 s = Scheme(Program('app',
@@ -248,6 +333,7 @@ s = Scheme(
 cmd(s, 'app -a12 -bx y z')
 cmd(s, 'app -A=12')
 cmd(s, 'app --gamma.49 --beta::1 23 47 0')
+cmd(s, 'app -A=x=y --beta::k=v w=z')
 
 
 #------------------------------------------------------------------------------#
@@ -272,3 +358,16 @@ s = Scheme(
 cmd(s, 'app -az')
 cmd(s, 'app -ab')
 cmd(s, 'app -abg')
+
+
+#------------------------------------------------------------------------------#
+s = Scheme(
+    Program('pmt',
+            members=('all',)),
+
+        Pattern('all',
+                short_flags='a',
+                value_type=Pattern.STATE_SWITCH))
+
+cmd(s, '/usr/bin/pmt -a')
+cmd(s, '/usr/bin/pmt /usr/bin/pmt')
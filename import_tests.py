@@ -0,0 +1,74 @@
+## INFO ##
+## INFO ##
+
+# Import python modules
+from sys        import executable
+from subprocess import run, PIPE
+
+# Modules which should only be imported when they are actually used: help
+# rendering, graph construction, scheme caching and line parsing
+LAZY_MODULES = {'textwrap', 'shutil', 'dagger', 'dagger.graph', 'dagger.tools',
+                'orderedset', 'hashlib', 'tempfile', 're', 'argon.generator',
+                'argon.cache', 'argon.sources', 'mmap',
+                'argon.memo', 'argon.result', 'argon.helpfile', 'threading'}
+
+# Budget of the import time of the argon modules (in microseconds)
+BUDGET = 30000
+
+
+#------------------------------------------------------------------------------#
+# Run python with -X importtime and collect the (self) import times
+def import_times(statement):
+    process = run((executable, '-X', 'importtime', '-c', statement),
+                  stderr=PIPE, universal_newlines=True)
+    times = {}
+    for line in process.stderr.splitlines():
+        try:
+            own, _, module = line.split('|')
+            times[module.strip()] = int(own.split()[-1])
+        except ValueError:
+            pass
+    return times
+
+
+#------------------------------------------------------------------------------#
+def check(statement):
+    print('\n' + '-'*80)
+    print('Statement:', statement, sep='\n    ')
+    times    = import_times(statement)
+    total    = sum(t for m, t in times.items() if m.startswith('argon'))
+    unneeded = sorted(LAZY_MODULES.intersection(times))
+    print('Import time:', '{:,}us'.format(total), sep='\n    ')
+    if unneeded:
+        print('[FAIL] imported:', *unneeded)
+    elif total > BUDGET:
+        print('[FAIL] over budget: {:,}us'.format(BUDGET))
+    else:
+        print('[PASS]')
+
+
+#------------------------------------------------------------------------------#
+# Run python and check if it writes the expected output (the text objects have
+# to work even if nothing else of argon has been imported before)
+def output(statement, expected):
+    print('\n' + '-'*80)
+    print('Statement:', statement, sep='\n    ')
+    process = run((executable, '-c', statement),
+                  stdout=PIPE, stderr=PIPE, universal_newlines=True)
+    if process.stdout != expected:
+        print('[FAIL] output:', repr(process.stdout),
+              *process.stderr.splitlines()[-1:], sep='\n    ')
+    else:
+        print('[PASS]')
+
+
+#------------------------------------------------------------------------------#
+# Tests
+check('import argon')
+check('from argon import *')
+check('from argon import *; '
+      'Program("app", members=(Pattern("this"),)).description')
+output('import sys; from argon import Section, Header, Paragraph; '
+       'Section(Header("X"), Paragraph("y")).write(indent=0, '
+       'stream=sys.stdout, width=80, spaces="  ", owner=None, patterns={})',
+       'X\n  y\n\n')
@@ -1,8 +1,22 @@
 ## INFO ##
 ## INFO ##
 
+# Import python modules
+from io        import BytesIO, StringIO
+from os        import listdir
+from os.path   import join
+from sys       import path, getswitchinterval, setswitchinterval
+from textwrap  import fill
+from tempfile  import TemporaryDirectory
+from itertools import chain
+from concurrent.futures import ThreadPoolExecutor
+
 # Import argin modules
-from argon import *
+from argon          import *
+from argon.text     import Wrapped
+from argon.scheme   import HELP_CACHE_SIZE
+from argon.helpfile import build_help_file, HelpFile
+from argon.sources  import stream_arguments
 
 
 #------------------------------------------------------------------------------#
@@ -108,6 +122,307 @@ translate_traverse(
                                          'status', 'closed',
                                          'labels', 'MyLabel',))
 
+# Compiled scheme cache: the second scheme is loaded from the cache
+with TemporaryDirectory() as directory:
+    command  = ('pmt', 'add', 'issues', '-t', 'labels', '-m', 'open',
+                                       '-v', 'status', 'closed')
+    expected = scheme1.parse_iter(command)
+    for _ in range(2):
+        cached = Scheme(*scheme1._patterns.values(), cache=directory)
+        print('[PASS]' if cached.parse_iter(command) == expected else '[FAIL]',
+              'cached scheme:', *listdir(directory))
+
+# Generated parser module: same result without importing argon
+with TemporaryDirectory() as directory:
+    scheme1.generate_module(join(directory, 'pmt_parser.py'))
+    path.insert(0, directory)
+    from pmt_parser import parse_iter
+    path.remove(directory)
+    print('[PASS]' if parse_iter(command) == expected else '[FAIL]',
+          'generated parser')
+
+# Argument sources: response files (nested ones too) and NUL-separated streams
+with TemporaryDirectory() as directory:
+    labels = join(directory, 'labels.rsp')
+    with open(labels, 'w') as file:
+        file.write('-v\nstatus\nclosed\n')
+    with open(join(directory, 'command.rsp'), 'w') as file:
+        file.write('-t\nlabels\n-m\nopen\n@' + labels + '\n')
+    print('[PASS]' if scheme1.parse_response_files(
+                          ('pmt', 'add', 'issues',
+                           '@' + join(directory, 'command.rsp'))) == expected
+          else '[FAIL]', 'response files')
+print('[PASS]' if scheme1.parse_stream(
+                      BytesIO('\0'.join(command).encode())) == expected
+      else '[FAIL]', 'NUL-separated stream')
+print('[PASS]' if (scheme1.parse_stream(
+                       StringIO('\0'.join(command) + '\0')) == expected and
+                   list(stream_arguments(StringIO('a\0b'), chunk_size=1)) ==
+                       ['a', 'b'])
+      else '[FAIL]', 'NUL-separated text stream')
+
+# Shell-like lines: quotes, escapes and comments are processed like shlex does
+line = 'pmt add issues -t "labels" -m \'open\' -v status clo\\sed # comment'
+print('[PASS]' if scheme1.parse_line(line, posix=True,
+                                     comments=True) == expected
+      else '[FAIL]', 'POSIX line')
+
+# Memoized results: the same frozen result is returned for the same arguments
+memoized = Scheme(*scheme1._patterns.values(), memoize=1)
+results  = [memoized.parse_iter(command),
+            memoized.parse_args(*command),
+            memoized.parse_args('pmt', 'add', 'issues', '-t', 'labels'),
+            memoized.parse_iter(command)]
+print('[PASS]' if (results[0] is results[1] and
+                   results[0] is not results[3] and
+                   isinstance(results[0][0][2], tuple) and
+                   memoized.memo_info() == (1, 3, 2, 1, 1))
+      else '[FAIL]', 'memoized results:', memoized.memo_info())
+
+# Compact results: the traverse functions yield the same as with tuples
+compacted = Scheme(*scheme1._patterns.values(), compact=True).parse_iter(command)
+print('[PASS]' if (
+    list(compacted) == expected and
+    list(Scheme.branch_traverse(compacted)) ==
+        list(Scheme.branch_traverse(expected)) and
+    [(g, f, v, list(m)) for g, f, v, m in
+        Scheme.breadth_first_traverse(compacted)] ==
+        list(Scheme.breadth_first_traverse(expected)) and
+    [tuple(p) for p, v in Scheme.branch_full_traverse(compacted)] ==
+        [tuple(p) for p, v in Scheme.branch_full_traverse(expected)])
+      else '[FAIL]', 'compact results')
+
+# Memoized compact results cannot be modified by the callers
+frozen  = Scheme(*scheme1._patterns.values(), memoize=4, compact=True)
+results = []
+for modify in (lambda node: setattr(node, 'value', 'HACKED'),
+               lambda node: delattr(node, 'members')):
+    try:
+        modify(frozen.parse_iter(command)[0].members[0])
+        results.append(False)
+    except AttributeError:
+        results.append(True)
+results.append(list(frozen.parse_iter(command)) == expected)
+print('[PASS]' if all(results) else '[FAIL]', 'frozen compact results')
+
+# Queries: translated patterns by long flags and by context paths
+query = scheme1.query(('pmt', 'set', 'issues', '-t', 'milestones', '-m', 'open',
+                                               '-t', 'issues', '-L', 'Label'))
+print('[PASS]' if (query.get('set')[1] == 'issues' and
+                   [t[1] for t in query.all('--target')] == ['milestones',
+                                                             'issues'] and
+                   query.at(('pmt', 'set', '--target', '--milestone')) ==
+                       (('milestone', 'open', []),) and
+                   '--values' not in query)
+      else '[FAIL]', 'query')
+
+# Nested traversals do not share their paths
+outer = [(tuple(path), [tuple(p) for p, _ in Scheme.branch_full_traverse(expected)])
+         for path, _ in Scheme.branch_full_traverse(expected)]
+print('[PASS]' if (outer[-1][0] == ('pmt', 'add', 'values') and
+                   all(paths == outer[0][1] for _, paths in outer) and
+                   [p for p, _ in outer] == outer[0][1] ==
+                   [p for p, _ in Scheme.branch_full_traverse(expected,
+                                                              immutable=True)])
+      else '[FAIL]', 'nested traversals')
+
+# Help texts: written to streams without file descriptors, rendered once
+help_texts = [StringIO(), StringIO()]
+help_block = Section(Header('COMMANDS'), 'add', 'set')
+for stream in help_texts:
+    scheme1.write_help(help_block, file=stream, width=40)
+# Blocks created again for the same help text use the cached text
+scheme1.write_help(Section(Header('COMMANDS'), 'add', 'set'),
+                   file=StringIO(), width=40)
+cached = len(scheme1._help) == 1
+for width in range(40, 140):
+    scheme1.write_help(help_block, file=StringIO(), width=width)
+print('[PASS]' if (help_texts[0].getvalue() == help_texts[1].getvalue() and
+                   help_texts[0].getvalue().startswith('COMMANDS\n') and
+                   cached and
+                   len(scheme1._help) == HELP_CACHE_SIZE)
+      else '[FAIL]', 'help text cache')
+
+# Help file: the stored help text is the same as the rendered one
+with TemporaryDirectory() as directory:
+    build_help_file(scheme1, join(directory, 'help'), widths=(40, 80))
+    help_texts = [StringIO(), StringIO()]
+    with HelpFile(join(directory, 'help')) as help_file:
+        help_file.write('add', file=help_texts[0], width=60)
+    scheme1.write_help(*scheme1.context_blocks(('add',)),
+                       file=help_texts[1], width=40)
+    print('[PASS]' if help_texts[0].getvalue() == help_texts[1].getvalue()
+          else '[FAIL]', 'help file')
+
+# Context help: the context, its members and the options of the contexts above
+help_text = StringIO()
+scheme1.write_context_help(('pmt', 'add', 'target'), file=help_text, width=80)
+help_text = help_text.getvalue()
+print('[PASS]' if (help_text.startswith('-t <value>, --target') and
+                   help_text.index('--label-name') <
+                   help_text.index('INHERITED OPTIONS') <
+                   help_text.index('--values'))
+      else '[FAIL]', 'context help')
+
+# Wrapped paragraphs: the same lines as textwrap.fill at every width
+paragraph = ('Lorem ipsum dolor sit amet,  consectetur-adipiscing elit, sed '
+             'do\teiusmod tempor incididunt ut labore et dolore magna aliqua.')
+wrapped   = Wrapped(paragraph)
+lines     = 'Multi-line\nparagraph:\twith   tabs,\r\nand   well-known\x0cbreaks.'
+print('[PASS]' if (all(wrapped.fill(width, '  ') ==
+                       fill(paragraph, width, initial_indent='  ',
+                                              subsequent_indent='  ')
+                       for width in chain(range(3, 120), range(120, 2, -1))) and
+                   all(Wrapped(lines).fill(width, '') == fill(lines, width)
+                       for width in range(1, 80)))
+      else '[FAIL]', 'wrapped paragraph')
+
+# Threads: rendering and parsing with a shared scheme give the same results
+def render_and_parse(_):
+    results = []
+    for width in range(40, 120, 7):
+        results.append(scheme1._render((help_block,), width, 4, False))
+        results.append(repr(scheme1.parse_iter(command)))
+        results.append(repr(memoized.parse_iter(command)))
+    return results
+
+expected_results = render_and_parse(None)
+# Switch threads as often as possible
+interval = getswitchinterval()
+setswitchinterval(1e-6)
+with ThreadPoolExecutor(8) as executor:
+    threaded_results = list(executor.map(render_and_parse, range(64)))
+setswitchinterval(interval)
+print('[PASS]' if all(results == expected_results
+                      for results in threaded_results)
+      else '[FAIL]', 'threads')
+
+# Options of schemes: the same patterns shared by schemes with other options
+shared = Program('app', members=('define',)), Pattern('define',
+                                                      short_flags='D')
+print('[PASS]' if (Scheme(*shared, value_delimiter='=').parse_args(
+                       'app', '--define=x') == [('app', True,
+                                                 [('define', 'x', [])])] and
+                   Scheme(*shared, value_immediate=True).parse_args(
+                       'app', '-Dx') == [('app', True,
+                                          [('define', 'x', [])])] and
+                   Scheme(*shared).parse_args('app', '-D', 'x') ==
+                       [('app', True, [('define', 'x', [])])] and
+                   not (shared[1].value_delimiter or
+                        shared[1].value_immediate))
+      else '[FAIL]', 'shared patterns')
+
+# Changed schemes: patterns and members added and removed one by one parse the
+# same way as the schemes built at once, and cycles are still detected
+host   = Program('host', members=('verbose',))
+plugin = (Pattern('build', members=('target', 'verbose'),
+                  value_type=Pattern.STATE_SWITCH),
+          Pattern('target', short_flags='t'),
+          Pattern('verbose', short_flags='V', value_type=Pattern.STATE_SWITCH))
+built  = Scheme(host, *plugin).compile()
+built.add_member('host', 'build')
+for changed in (Scheme(host, plugin[2]), Scheme(host, plugin[2]).compile()):
+    changed.add_pattern(plugin[1])
+    changed.add_pattern(plugin[0])
+    changed.add_member('host', 'build')
+    command = 'host', '-V', '--build', '-t', 'x', '-V'
+    results = [changed.parse_iter(command) == built.parse_iter(command)]
+    changed.remove_pattern('build')
+    results.append(changed.parse_iter(('--target', 'x')) ==
+                   [('target', 'x', [])])
+    try:
+        changed.add_member('target', 'host')
+        changed.add_member('host', 'target')
+        results.append(False)
+    except Scheme.CircularReferences:
+        results.append(sorted(changed._hierarchy) == ['target'])
+    print('[PASS]' if all(results) else '[FAIL]', 'changed scheme')
+
+# Lazy members: patterns are only loaded when their flags are used, and they
+# parse the same way as the patterns passed to the scheme at once
+def load_status():
+    loaded.append('status')
+    return (Pattern('status', long_prefix='', members=('short',),
+                    value_type=Pattern.STATE_SWITCH),
+            Pattern('short', short_flags='s', value_type=Pattern.STATE_SWITCH))
+
+with TemporaryDirectory() as directory:
+    with open(join(directory, 'lazy_commit.py'), 'w') as file:
+        file.write('from argon import Pattern\n'
+                   'pattern = Pattern("commit", long_prefix="", '
+                   'value_type=Pattern.SINGLE_VALUE)\n')
+    path.insert(0, directory)
+    loaded = []
+    lazy   = Scheme(Program('tool', members=(Lazy('status', load_status),
+                                             Lazy('commit',
+                                                  'lazy_commit:pattern'))))
+    eager  = Scheme(Program('tool', members=('status', 'commit')),
+                    *load_status(), Pattern('commit', long_prefix=''))
+    loaded.clear()
+    command = 'tool', 'status', '-s'
+    results = [lazy.parse_iter(('tool',)) == [('tool', True, [])] and
+                   not loaded,
+               lazy.parse_iter(('tool', 'commit', 'statusbar')) ==
+                   [('tool', True, [('commit', 'statusbar', [])])] and
+                   not loaded,
+               lazy.parse_iter(command) == eager.parse_iter(command) and
+                   loaded == ['status'],
+               lazy.compile().parse_iter(('tool', 'commit', 'x')) ==
+                   [('tool', True, [('commit', 'x', [])])],
+               not lazy._lazy and not lazy._lazy_flags and
+                   loaded == ['status']]
+    path.remove(directory)
+
+# Lazy members with callable loaders are cached by the same compiled scheme
+# (the loaders are different, but equivalent objects, as in different runs)
+with TemporaryDirectory() as directory:
+    loaders = [lambda: load_status() for _ in range(3)]
+    for loader in loaders:
+        Scheme(Program('tool', members=(Lazy('status', loader),)),
+               cache=directory)
+    results.append(len(listdir(directory)) == 1)
+print('[PASS]' if all(results) else '[FAIL]', 'lazy members')
+
+# Batches: parse_many yields the same results as parse_iter (compact and
+# memoized results too), in this process and in other processes as well
+commands = [('pmt', 'add', 'issues', '-t', 'labels', '-m', 'open'),
+            ('pmt', 'set', 'issues', '-v', 'status', 'closed')]*3
+results  = []
+for options in ({}, {'compact': True, 'memoize': 8}):
+    batched = Scheme(*scheme1._patterns.values(), **options)
+    for workers in (None, 2):
+        results.append(list(batched.parse_many(commands, workers=workers)) ==
+                       [batched.parse_iter(c) for c in commands])
+    results.append(batched._dispatch is None)
+print('[PASS]' if all(results) else '[FAIL]', 'parse many')
+
+# Program aliases: only the program selected by the path of the program is
+# loaded, and the names of the other programs are still out of its context
+def load_alias(name):
+    def load():
+        loaded.append(name)
+        return (Program(name, members=('all',)),
+                Pattern('all', short_flags='a', value_type=Pattern.STATE_SWITCH))
+    return load
+
+loaded  = []
+aliases = Scheme(*(Lazy(name, load_alias(name)) for name in ('ls', 'dir')))
+results = [aliases.compile().parse_iter(('/bin/ls', '-a')) ==
+               [('ls', True, [('all', True, [])])] and loaded == ['ls']]
+try:
+    aliases.parse_iter(('ls', 'dir'))
+    results.append(False)
+except Scheme.ArgumentOutOfContext:
+    results.append(True)
+# Flags with separated values are not mistaken for paths of programs
+delimited = Scheme(Pattern('output', value_delimiter='='),
+                   Program('tmp', members=('x',)),
+                   Pattern('x'))
+for parser in (delimited, delimited.compile()):
+    results.append(parser.parse_args('--output=/var/tmp') ==
+                   [('output', '/var/tmp', [])])
+print('[PASS]' if all(results) else '[FAIL]', 'program aliases')
+
 try:
     translate_traverse(
         scheme2,